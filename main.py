@@ -15,7 +15,10 @@ def main():
         layout="wide",
         initial_sidebar_state="expanded"
     )
-    st.write(
+    # Re-emitted on every rerun on purpose: Streamlit removes elements
+    # that are not re-rendered, so gating this behind session state would
+    # drop the icon stylesheet after the first interaction.
+    st.markdown(
         '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.2.0/css/all.min.css"/>',
         unsafe_allow_html=True)
     app = CassandraGUIApp()
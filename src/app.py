@@ -9,17 +9,167 @@ Coordinates all components of the Cassandra GUI client:
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any
 
-import pandas as pd
 import streamlit as st
 
+from cassandra import ConsistencyLevel
+
 from src.config.settings import ConfigManager, ConnectionProfile
-from src.database.connection import CassandraConnectionManager
+from src.database.connection import CassandraConnectionManager, PANDAS_PROFILE
 from src.database.schema import SchemaInspector, TableSchema
 from src.utils.ssl import supported_ssl_protocols
 
 
+# Compiled once at import so Execute clicks skip the re-module cache probe.
+_LIMIT_RE = re.compile(r'\bLIMIT\s+(\d+)', re.IGNORECASE)
+
+# Safety cap for CQL editor results without an explicit LIMIT.
+_MAX_EDITOR_ROWS = 10_000
+
+# CQL type name -> pandas dtype, for columns where the driver's metadata
+# lets us skip pandas' per-column object inference. Nullable Int64 keeps
+# integer columns integral even when some rows are null.
+_CQL_TO_PANDAS = {
+    'int': 'Int64',
+    'bigint': 'Int64',
+    'smallint': 'Int64',
+    'tinyint': 'Int64',
+    'varint': 'Int64',
+    'counter': 'Int64',
+    'float': 'float64',
+    'double': 'float64',
+    'boolean': 'boolean',
+    'timestamp': 'datetime64[ns]',
+}
+
+
+@lru_cache(maxsize=256)
+def _prepared(session, cql: str):
+    """
+    Prepare a CQL statement once per (session, query text).
+
+    Re-preparing the same query on every click forces the coordinator to
+    re-parse it each time; caching the PreparedStatement keeps the hot
+    CRUD paths on the cheap bind-and-execute path.
+    """
+    prepared = session.prepare(cql)
+    prepared.consistency_level = ConsistencyLevel.ONE
+    return prepared
+
+
+@lru_cache(maxsize=256)
+def _select_cql(keyspace: str, table: str, columns: tuple,
+                filter_names: tuple, allow_filtering: bool) -> str:
+    """
+    Canonical SELECT text for a (table, projection, filter set).
+
+    Filter names arrive pre-sorted, so the same filter set always yields
+    byte-identical CQL — which is what lets the PreparedStatement cache
+    hit across reruns instead of re-preparing per string-building order.
+    No LIMIT is emitted: page size is enforced through the driver's
+    fetch_size so the server pages results and a paging_state cursor can
+    resume where the previous page ended. ALLOW FILTERING is only
+    appended when the caller determined the filter cannot be served as a
+    key lookup.
+    """
+    query = f"SELECT {', '.join(columns)} FROM {keyspace}.{table}"
+    if filter_names:
+        where = " AND ".join(f"{k} = ?" for k in filter_names)
+        query = f"{query} WHERE {where}"
+    if allow_filtering:
+        query = f"{query} ALLOW FILTERING"
+    return query
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_keyspaces(_inspector, session_id: int) -> list:
+    """Keyspace list cached across reruns, keyed by the live session."""
+    return _inspector.get_keyspaces()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_tables(_inspector, session_id: int, keyspace: str) -> list:
+    """Table list cached across reruns, keyed by (session, keyspace)."""
+    return _inspector.get_tables(keyspace)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_schema(_inspector, session_id: int, keyspace: str, table: str) -> TableSchema:
+    """Table schema cached across reruns, keyed by (session, keyspace, table)."""
+    return _inspector.get_table_schema(keyspace, table)
+
+
+def _execute_page_async(session, keyspace: str, table: str, columns: tuple,
+                        filter_items: tuple, page_size: int,
+                        allow_filtering: bool, paging_state: bytes = None):
+    """Submit one page of the grid SELECT and return the ResponseFuture.
+
+    Shared by the blocking fetch path and the next-page prefetch, so both
+    build identical statements (same cached PreparedStatement, same
+    fetch_size) and differ only in when .result() is called.
+    """
+    query = _select_cql(keyspace, table, columns,
+                        tuple(name for name, _ in filter_items),
+                        allow_filtering)
+    statement = _prepared(session, query).bind(tuple(v for _, v in filter_items))
+    statement.fetch_size = page_size
+    return session.execute_async(statement, paging_state=paging_state,
+                                 execution_profile=PANDAS_PROFILE)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_rows(_session, keyspace: str, table: str, columns: tuple,
+                filter_items: tuple, page_size: int,
+                allow_filtering: bool, paging_state: bytes = None):
+    """
+    Fetch a page of rows as a DataFrame, cached per (keyspace, table,
+    columns, filters, page size, paging cursor).
+
+    Streamlit reruns the whole script on every interaction, so without
+    this cache every unrelated widget change re-issues the SELECT.
+    Only the requested columns are fetched (projection pushdown), so
+    hidden blob/map columns never cross the wire. `filter_items` is a
+    sorted tuple of (column, coerced value) pairs so equal filter sets
+    share a cache entry. Writes invalidate the cache via
+    `_fetch_rows.clear()`.
+
+    The pandas execution profile builds the DataFrame inside the driver's
+    row factory, skipping the dict-per-row allocation entirely.
+
+    Returns:
+        Tuple of (DataFrame, paging_state for the next page or None).
+    """
+    # Submit asynchronously and materialize only one driver page instead
+    # of list(rows), which would drain every page before the grid can
+    # render anything. The server enforces the page size via fetch_size.
+    future = _execute_page_async(_session, keyspace, table, columns,
+                                 filter_items, page_size, allow_filtering,
+                                 paging_state)
+    result = future.result()
+    next_state = result.paging_state if result.has_more_pages else None
+    return result.current_rows, next_state
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap():
+    """Build the long-lived managers once per server process.
+
+    st.cache_resource hands back the same instances on every rerun, so
+    the config file is parsed and the managers constructed exactly once
+    rather than being re-checked in session state per interaction.
+
+    Returns:
+        Tuple of (ConfigManager, CassandraConnectionManager).
+    """
+    config = ConfigManager()
+    config.load()
+    return config, CassandraConnectionManager()
+
+
 # noinspection SqlNoDataSourceInspection,PyTypeChecker
 class CassandraGUIApp:
     """
@@ -27,28 +177,25 @@ class CassandraGUIApp:
     """
 
     def __init__(self):
-        # Initialize session state
-        if 'config_manager' not in st.session_state:
-            st.session_state.config_manager = ConfigManager()
-        if 'connection_manager' not in st.session_state:
-            st.session_state.connection_manager = CassandraConnectionManager()
+        # The heavy managers come from the cache_resource factory, so the
+        # constructor rerunning on every interaction costs two attribute
+        # assignments instead of a series of session-state probes.
+        self._config, self._connection = _bootstrap()
+
         if 'schema_inspector' not in st.session_state:
             st.session_state.schema_inspector = None
-        
-        self._config = st.session_state.config_manager
-        self._connection = st.session_state.connection_manager
-        
-        # Load settings
-        if 'settings' not in st.session_state:
-            st.session_state.settings = self._config.load()
 
     def run(self):
         """Run the main application loop."""
+        self._poll_pending_connection()
         self._render_sidebar()
         self._render_main_content()
         self._render_delete_confirmation()
         self._render_row_details()
         self._render_map_schema_editor()
+        # Flush any metadata mutations accumulated during this rerun in
+        # one write (also covered by atexit on shutdown).
+        self._config.flush()
 
     def _render_sidebar(self):
         """Render the sidebar for navigation and connection management."""
@@ -84,7 +231,8 @@ class CassandraGUIApp:
                 st.divider()
                 st.header("Schema")
 
-                keyspaces = st.session_state.schema_inspector.get_keyspaces()
+                session_id = id(self._connection.session)
+                keyspaces = _cached_keyspaces(st.session_state.schema_inspector, session_id)
                 if self._connection.current_profile.default_keyspace:
                     try:
                         idx = keyspaces.index(self._connection.current_profile.default_keyspace)
@@ -95,7 +243,7 @@ class CassandraGUIApp:
                 selected_ks = st.selectbox("Keyspace", keyspaces, index=idx, key="selected_keyspace")
                 
                 if selected_ks:
-                    tables = st.session_state.schema_inspector.get_tables(selected_ks)
+                    tables = _cached_tables(st.session_state.schema_inspector, session_id, selected_ks)
                     selected_table = st.selectbox("Table", tables, key="selected_table")
                     
                     if selected_table:
@@ -103,9 +251,10 @@ class CassandraGUIApp:
                         if 'current_table_name' not in st.session_state or st.session_state.current_table_name != selected_table:
                             st.session_state.current_table_name = selected_table
                             st.session_state.paging_state = None
-                            st.session_state.page_history = []
-                        
-                        st.session_state.current_table_schema = st.session_state.schema_inspector.get_table_schema(selected_ks, selected_table)
+
+                        # Keep only the reference; the full schema is
+                        # materialized lazily where a tab needs it.
+                        st.session_state.current_table_ref = (selected_ks, selected_table)
 
     def _render_main_content(self):
         """Render the main content area."""
@@ -113,26 +262,43 @@ class CassandraGUIApp:
             st.info("Please select a connection and click 'Connect' to start.")
             return
 
-        if 'current_table_schema' in st.session_state and st.session_state.current_table_schema:
-            schema = st.session_state.current_table_schema
-            st.header(f"Table: {schema.keyspace}.{schema.table_name}")
-            
+        if st.session_state.get('current_table_ref'):
+            keyspace, table = st.session_state.current_table_ref
+            st.header(f"Table: {keyspace}.{table}")
+
             tab1, tab2, tab3, tab4 = st.tabs(["Data Browser", "Insert Record", "Table Info", "CQL Editor"])
-            
+
+            # Resolved on demand (and cached); the CQL Editor tab never
+            # needs column metadata.
+            schema = self._current_schema()
+
             with tab1:
                 self._render_data_grid(schema)
-            
+
             with tab2:
                 self._render_insert_form(schema)
-                
+
             with tab3:
                 self._render_table_info(schema)
-                
+
             with tab4:
                 self._render_cql_editor()
         else:
             st.info("Select a keyspace and table from the sidebar to view data.")
 
+    def _current_schema(self) -> TableSchema | None:
+        """Materialize the schema for the selected table reference."""
+        ref = st.session_state.get('current_table_ref')
+        if not ref or not st.session_state.schema_inspector:
+            return None
+        keyspace, table = ref
+        return _cached_schema(
+            st.session_state.schema_inspector,
+            id(self._connection.session),
+            keyspace,
+            table
+        )
+
     def _render_connection_form(self):
         """Render form for adding/editing connections."""
         
@@ -205,124 +371,222 @@ class CassandraGUIApp:
                 st.rerun()
 
     def _connect_to_profile(self, name: str):
-        """Connect to the selected profile."""
+        """Submit a connection attempt without blocking the rerun."""
         profile = self._config.get_connection(name)
         if profile:
+            if 'executor' not in st.session_state:
+                st.session_state.executor = ThreadPoolExecutor(max_workers=2)
+            st.session_state.connect_future = st.session_state.executor.submit(
+                self._connection.connect, profile
+            )
+            st.session_state.connect_profile_name = name
+            st.rerun()
+
+    def _poll_pending_connection(self):
+        """Check on a connection attempt submitted by _connect_to_profile.
+
+        The cluster handshake (control connection, node discovery, metadata
+        fetch) can take hundreds of milliseconds; running it on the executor
+        keeps the script responsive while we poll the future each rerun.
+        """
+        future = st.session_state.get('connect_future')
+        if future is None:
+            return
+
+        name = st.session_state.get('connect_profile_name', '')
+        if future.done():
+            del st.session_state.connect_future
+            st.session_state.pop('connect_profile_name', None)
+            result = future.result()
+            if result.success:
+                st.session_state.schema_inspector = SchemaInspector(self._connection.session)
+                st.success(f"Connected to {name}")
+            else:
+                st.error(f"Connection failed: {result.message}")
+        else:
             with st.spinner(f"Connecting to {name}..."):
-                result = self._connection.connect(profile)
-                if result.success:
-                    st.session_state.schema_inspector = SchemaInspector(self._connection.session)
-                    st.success(f"Connected to {name}")
-                    st.rerun()
-                else:
-                    st.error(f"Connection failed: {result.message}")
+                time.sleep(0.2)
+            st.rerun()
 
     def _disconnect(self):
         """Disconnect from the current cluster."""
         self._connection.disconnect()
         st.session_state.schema_inspector = None
-        if 'current_table_schema' in st.session_state:
-            del st.session_state.current_table_schema
+        # Drop cached metadata/rows tied to the old session
+        st.cache_data.clear()
+        if 'current_table_ref' in st.session_state:
+            del st.session_state.current_table_ref
         st.rerun()
 
     def _render_data_grid(self, schema: TableSchema):
         """Render the data grid and filters."""
-        # Determine visible columns
-        visible_columns = []
-        for col in schema.columns:
-            meta = self._config.get_column_metadata(schema.keyspace, schema.table_name, col.name)
-            if not meta.get("hide", False):
-                visible_columns.append(col)
-
-        # Filters
+        # Determine visible columns from the cached hidden-name set
+        # instead of one metadata lookup per column.
+        hidden = self._config.get_hidden_columns(schema.keyspace, schema.table_name)
+        visible_columns = [c for c in schema.columns if c.name not in hidden]
+
+        # Filters. Only key columns get an input by default; other columns
+        # are opted in through the multiselect, so the rerun payload stays
+        # O(keys + chosen) instead of one widget per column.
+        # The st.form defers reruns until "Apply filters" is clicked, so
+        # typing a filter value no longer issues one Cassandra query per
+        # keystroke.
         with st.expander("Filters"):
-            cols = st.columns(3)
-            filter_params = {}
-            for i, col in enumerate(schema.columns):
-                # Simple filter implementation
-                val = cols[i % 3].text_input(f"Filter {col.name}")
-                if val:
-                    filter_params[col.name] = val
+            with st.form("filter_form"):
+                filter_cols = list(schema.primary_key_columns)
+                other_names = [c.name for c in schema.columns if not c.is_primary_key]
+                if other_names:
+                    extra = st.multiselect("Filter additional columns", other_names)
+                    filter_cols += [schema.column(n) for n in extra]
+
+                cols = st.columns(3)
+                filter_params = {}
+                for i, col in enumerate(filter_cols):
+                    # Simple filter implementation
+                    val = cols[i % 3].text_input(f"Filter {col.name}")
+                    if val:
+                        filter_params[col.name] = val
+
+                st.form_submit_button("Apply filters")
         page_size = st.selectbox("Rows per page", [10, 25, 50], index=0, key="page_size_selector")
-        
-        # Query Data
-        query = f"SELECT * FROM {schema.keyspace}.{schema.table_name}"
-        
-        # Reset pagination if filters change (simple detection)
-        current_filter_hash = str(filter_params)
+
+        # Reset pagination if filters change. Hashing the sorted item
+        # tuple yields one int to compare instead of allocating and
+        # comparing a dict repr string on every rerun.
+        current_filter_hash = hash(tuple(sorted(filter_params.items())))
         if 'last_filter_hash' not in st.session_state or st.session_state.last_filter_hash != current_filter_hash:
             st.session_state.last_filter_hash = current_filter_hash
             st.session_state.paging_state = None
-            st.session_state.page_history = []
-
-        if filter_params:
-            where_clauses = []
-            for k, v in filter_params.items():
-                # "text"
-                if schema.column(k).cql_type == "text":
-                    where_clauses.append(f"{k} = '{v}'")
-                else:
-                # "int", "bigint", "float", "double", "uuid", "boolean", "timestamp"
-                    where_clauses.append(f"{k} = {v}")
-            query += " WHERE " + " AND ".join(where_clauses) + " LIMIT " + str(page_size) + " ALLOW FILTERING"
-            # Note: In a real app, handle type conversion for params
-            rows = self._connection.execute(query,)
+
+        # Push the column projection down into CQL instead of fetching
+        # SELECT * and hiding columns client-side. Primary key columns are
+        # always fetched so row actions (view/delete) keep working even
+        # when a key column is hidden in the browser.
+        visible_names = {c.name for c in visible_columns}
+        pk_names = {c.name for c in schema.primary_key_columns}
+        projection = tuple(
+            c.name for c in schema.columns
+            if c.name in visible_names or c.name in pk_names
+        )
+
+        # Query Data. Sort filter columns so identical filter sets map to
+        # one cached PreparedStatement regardless of input order.
+        filter_items = tuple(
+            (k, schema.parsers[k](filter_params[k]))
+            for k in sorted(filter_params)
+        )
+
+        # A filter covering the whole partition key plus a prefix of the
+        # clustering key is served as a key lookup; anything else needs
+        # ALLOW FILTERING and full-scans the table. Cassandra rejects
+        # equality on clustering column N without N-1, so a non-prefix
+        # clustering filter must keep ALLOW FILTERING too.
+        filter_names = set(filter_params)
+        partition_names = {c.name for c in schema.partition_keys}
+        clustering_order = [c.name for c in schema.clustering_keys]
+        filtered_clustering = filter_names.intersection(clustering_order)
+        is_clustering_prefix = (
+            filtered_clustering == set(clustering_order[:len(filtered_clustering)])
+        )
+        allow_filtering = bool(filter_params) and not (
+            filter_names <= pk_names
+            and partition_names <= filter_names
+            and is_clustering_prefix
+        )
+        if allow_filtering:
+            st.warning("Filtering on non-key columns will scan the whole table.")
+
+        fetch_key = (schema.keyspace, schema.table_name, projection,
+                     filter_items, page_size, allow_filtering,
+                     st.session_state.get('paging_state'))
+
+        # If the page we need was prefetched on the previous rerun, drain
+        # that in-flight future instead of firing a new query; the network
+        # round trip already overlapped with the user's think time.
+        prefetch = st.session_state.get('next_page_prefetch')
+        if prefetch is not None and prefetch[0] == fetch_key:
+            del st.session_state['next_page_prefetch']
+            result = prefetch[1].result()
+            df = result.current_rows
+            next_paging_state = result.paging_state if result.has_more_pages else None
         else:
-            rows = self._connection.execute(query + " LIMIT " + str(page_size))
+            df, next_paging_state = _fetch_rows(
+                self._connection.session,
+                schema.keyspace,
+                schema.table_name,
+                projection,
+                filter_items,
+                page_size,
+                allow_filtering,
+                st.session_state.get('paging_state')
+            )
 
-        # Display Data
-        data = list(rows)
-        
-        if data:
-            # Custom grid rendering to support row actions
+        # Prefetch the next page in the background so a "Next page" click
+        # finds its result already (mostly) on the wire. Kept if a rerun
+        # doesn't consume it, re-issued only when the cursor moves.
+        if next_paging_state is not None:
+            next_key = fetch_key[:-1] + (next_paging_state,)
+            pending = st.session_state.get('next_page_prefetch')
+            if pending is None or pending[0] != next_key:
+                st.session_state.next_page_prefetch = (
+                    next_key,
+                    _execute_page_async(
+                        self._connection.session,
+                        schema.keyspace,
+                        schema.table_name,
+                        projection,
+                        filter_items,
+                        page_size,
+                        allow_filtering,
+                        next_paging_state
+                    )
+                )
+
+        if not df.empty:
+            # Render all rows as a single dataframe payload instead of one
+            # Streamlit widget per cell.
             st.write("### Data")
-            
-            # Calculate column widths: 150px for actions, rest flexible
-            # Streamlit doesn't support exact pixel widths in st.columns easily, 
-            # but we can use a small ratio for the first column.
-            # Assuming a wide layout, 0.15 vs 1 is roughly 1:7 ratio.
-            col_spec = [0.4] + [1] * len(visible_columns)
-            cols = st.columns(col_spec)
-            
-            # Header
-            cols[0].markdown("**Actions**")
-            for i, col in enumerate(visible_columns):
-                if i + 1 < len(cols):
-                    cols[i+1].markdown(f"**{col.name}**")
-            
-            # Rows
-            for i, row in enumerate(data):
-                cols = st.columns(col_spec)
-                
-                # Actions Column
-                action_col = cols[0]
-                ac1, ac2 = action_col.columns(2)
-                
-                # View Details Action
-                if ac1.button("View", key=f"view_{i}", help="View Details"):
-                    self._show_row_details(row)
+            event = st.dataframe(
+                df[[c.name for c in visible_columns]],
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="data_grid"
+            )
+
+            # Row actions target the dataframe's own row selection, so no
+            # extra picker widget is needed.
+            selected_rows = event.selection.rows
+            has_selection = bool(selected_rows)
+            ac1, ac2 = st.columns([1, 5])
+            # The dialogs expect dict rows; convert only the acted-on row.
+            if ac1.button("View", help="View Details", disabled=not has_selection):
+                self._show_row_details(df.iloc[selected_rows[0]].to_dict())
+            if ac2.button("Delete", help="Delete Row", disabled=not has_selection):
+                self._confirm_delete(schema, df.iloc[selected_rows[0]].to_dict())
+
+            # Forward-only server-side pagination: the opaque cursor for
+            # the next page is the only state kept.
+            nav1, nav2 = st.columns([1, 5])
+            if nav1.button("First page", disabled=st.session_state.get('paging_state') is None):
+                st.session_state.paging_state = None
+                st.rerun()
+            if nav2.button("Next page", disabled=next_paging_state is None):
+                st.session_state.paging_state = next_paging_state
+                st.rerun()
 
-                # Delete Action
-                if ac2.button("Delete", key=f"del_{i}", help="Delete Row"):
-                    self._confirm_delete(schema, row)
-                
-                # Data
-                for j, col in enumerate(visible_columns):
-                    if j + 1 < len(cols):
-                        # row is a dict because of dict_factory in connection.py
-                        val = row.get(col.name)
-                        cols[j+1].write(str(val))
-                        
         else:
             st.info("No data found.")
 
     @staticmethod
     def _confirm_delete(schema: TableSchema, row: Any):
-        """Show confirmation dialog for deletion."""
-        st.session_state.delete_target = {
-            'schema': schema,
-            'row': row
-        }
+        """Queue a row for deletion and show the confirmation dialog."""
+        if 'delete_target' not in st.session_state:
+            st.session_state.delete_target = {
+                'schema': schema,
+                'rows': []
+            }
+        st.session_state.delete_target['rows'].append(row)
         st.rerun()
 
     def _render_delete_confirmation(self):
@@ -330,19 +594,19 @@ class CassandraGUIApp:
         if 'delete_target' in st.session_state:
             target = st.session_state.delete_target
             schema = target['schema']
-            row = target['row']
-            
+            rows = target['rows']
+
             # Use a container at the top or a modal-like expander
             with st.container():
-                st.warning("⚠️ Are you sure you want to delete this record?")
-                st.json(row)  # Display the row data clearly
-                
+                st.warning(f"⚠️ Are you sure you want to delete {len(rows)} record(s)?")
+                st.json(rows)  # Display the row data clearly
+
                 col1, col2 = st.columns([1, 5])
-                if col1.button("Yes, Delete", type="primary"):
-                    self._delete_record(schema, row)
+                if col1.button(f"Yes, Delete {len(rows)}", type="primary"):
+                    self._delete_records(schema, rows)
                     del st.session_state.delete_target
                     st.rerun()
-                
+
                 if col2.button("Cancel"):
                     del st.session_state.delete_target
                     st.rerun()
@@ -357,7 +621,7 @@ class CassandraGUIApp:
         """Render row details dialog if needed."""
         if 'view_details_target' in st.session_state:
             row = st.session_state.view_details_target
-            schema = st.session_state.current_table_schema
+            schema = self._current_schema()
             
             with st.container():
                 st.markdown("---")
@@ -444,7 +708,7 @@ class CassandraGUIApp:
                     st.error(f"Invalid JSON for column {col.name}")
                     return
 
-            set_parts.append(f"{col.name} = %s")
+            set_parts.append(f"{col.name} = ?")
             set_values.append(new_val)
             
         # Build WHERE clause using primary key from original row
@@ -452,7 +716,7 @@ class CassandraGUIApp:
         where_values = []
         for col in schema.primary_key_columns:
             val = original_row.get(col.name)
-            where_parts.append(f"{col.name} = %s")
+            where_parts.append(f"{col.name} = ?")
             where_values.append(val)
             
         if not set_parts:
@@ -467,25 +731,30 @@ class CassandraGUIApp:
         except Exception as e:
             st.error(f"Update failed: {str(e)}")
 
-    def _delete_record(self, schema: TableSchema, row: Any):
-        """Delete a record."""
-        keyspace = schema.keyspace
-        table = schema.table_name
-        
-        # Build WHERE clause using primary key
-        where_parts = []
-        where_values = []
-        for col in schema.primary_key_columns:
-            # row is a dict
-            val = row.get(col.name)
-            where_parts.append(f"{col.name} = %s")
-            where_values.append(val)
-            
-        query = f"DELETE FROM {keyspace}.{table} WHERE {' AND '.join(where_parts)}"
-        
+    def _delete_records(self, schema: TableSchema, rows: list):
+        """Delete queued records with driver-level fan-out.
+
+        Each delete is submitted via execute_async against the cached
+        PreparedStatement and the futures are drained afterwards, so N
+        deletes overlap into roughly one round trip instead of N
+        sequential ones. A BatchStatement is deliberately avoided: the
+        rows usually span partitions, where unlogged batches only add
+        coordinator load.
+        """
         try:
-            self._connection.execute(query, tuple(where_values))
-            st.success("Record deleted successfully")
+            session = self._connection.session
+            prepared = _prepared(session, schema.delete_cql)
+            futures = [
+                session.execute_async(
+                    # row is a dict
+                    prepared.bind(tuple(row.get(n) for n in schema.primary_key_names))
+                )
+                for row in rows
+            ]
+            for future in futures:
+                future.result()
+            _fetch_rows.clear()
+            st.success(f"Deleted {len(rows)} record(s) successfully")
         except Exception as e:
             st.error(f"Delete failed: {str(e)}")
 
@@ -494,30 +763,100 @@ class CassandraGUIApp:
         with st.form("insert_form"):
             st.subheader("New Record")
             form_data = {}
-            
+
             cols = st.columns(2)
             for i, col in enumerate(schema.columns):
                 # Basic input field generation based on type could be improved
                 form_data[col.name] = cols[i % 2].text_input(f"{col.name} ({col.cql_type})")
-            
+
             if st.form_submit_button("Insert"):
                 # Filter out empty strings
                 data = {k: v for k, v in form_data.items() if v}
                 if data:
                     self._insert_record(schema, data)
 
+        with st.expander("Bulk insert from CSV"):
+            st.caption("CSV headers must match column names; unknown columns are ignored.")
+            uploaded = st.file_uploader("CSV file", type="csv", key="bulk_insert_csv")
+            if uploaded is not None and st.button("Insert CSV rows"):
+                import pandas as pd
+                self._insert_batch(schema, pd.read_csv(uploaded))
+
+    def _insert_batch(self, schema: TableSchema, df):
+        """Insert a DataFrame of records with driver-level concurrency.
+
+        Columns are coerced in bulk with pandas' vectorized converters
+        instead of one parser call per cell, then all rows are bound to
+        a single cached PreparedStatement and written via
+        execute_concurrent_with_args, so the batch costs a handful of
+        overlapped round trips rather than one per row.
+        """
+        import pandas as pd
+        from cassandra.concurrent import execute_concurrent_with_args
+
+        columns = sorted(c for c in df.columns if schema.column(c) is not None)
+        if not columns:
+            st.error("No CSV columns match the table schema.")
+            return
+
+        frame = df[columns].copy()
+        for name in columns:
+            cql_type = schema.column(name).cql_type
+            if cql_type in ('int', 'bigint', 'varint', 'smallint', 'tinyint', 'counter'):
+                frame[name] = pd.to_numeric(frame[name], errors='coerce').astype('Int64')
+            elif cql_type in ('float', 'double', 'decimal'):
+                frame[name] = pd.to_numeric(frame[name], errors='coerce')
+            elif cql_type == 'timestamp':
+                frame[name] = pd.to_datetime(frame[name], errors='coerce')
+
+        # Nulls must reach the driver as None, not NaN/NaT/pd.NA.
+        frame = frame.astype(object).where(frame.notna(), None)
+
+        query = (f"INSERT INTO {schema.keyspace}.{schema.table_name} "
+                 f"({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})")
+
+        try:
+            session = self._connection.session
+            prepared = _prepared(session, query)
+            results = execute_concurrent_with_args(
+                session, prepared,
+                frame.itertuples(index=False, name=None),
+                concurrency=64
+            )
+            failures = [exc for ok, exc in results if not ok]
+            _fetch_rows.clear()
+            if failures:
+                st.error(f"{len(failures)} of {len(results)} rows failed; "
+                         f"first error: {failures[0]}")
+            else:
+                st.success(f"Inserted {len(results)} record(s) successfully")
+        except Exception as e:
+            st.error(f"Bulk insert failed: {str(e)}")
+
     def _render_table_info(self, schema: TableSchema):
         """Render table schema information."""
         st.subheader("Table Schema")
-        
+
+        # Allocate the column spec once; the row loop reuses it instead of
+        # building a fresh list per iteration.
+        col_spec = (2, 2, 2, 2, 2)
+
         # Header
-        cols = st.columns([2, 2, 2, 2, 2])
+        cols = st.columns(col_spec)
         cols[0].markdown("**Column Name**")
         cols[1].markdown("**Type**")
         cols[2].markdown("**Key Type**")
         cols[3].markdown("**Hide in Data Browser**", help="Check to hide this column in the Data Browser tab. Useful for large columns like maps or lists.")
         cols[4].markdown("**Map Schema**", help="Define fixed schema for MAP columns.")
 
+        # Collect metadata diffs and persist them in one write after the
+        # loop, so toggling several checkboxes costs one save + one rerun
+        # instead of one of each per column.
+        changes = []
+
+        # One lookup for the whole table instead of one per column.
+        table_meta = self._config.get_table_column_metadata(schema.keyspace, schema.table_name)
+
         for col in schema.all_columns_sorted:
             key_type = ""
             if col.is_partition_key:
@@ -526,10 +865,10 @@ class CassandraGUIApp:
                 key_type = f"Clustering Key ({col.clustering_order})"
             
             # Get current metadata state
-            meta = self._config.get_column_metadata(schema.keyspace, schema.table_name, col.name)
+            meta = table_meta.get(col.name, {})
             is_hidden = meta.get("hide", False)
 
-            cols = st.columns([2, 2, 2, 2, 2])
+            cols = st.columns(col_spec)
             cols[0].write(col.name)
             cols[1].write(col.cql_type)
             cols[2].write(key_type)
@@ -542,16 +881,9 @@ class CassandraGUIApp:
                 label_visibility="hidden"
             )
             
-            # Update config if changed
+            # Record diff if changed
             if new_hidden != is_hidden:
-                self._config.set_column_metadata(
-                    schema.keyspace, 
-                    schema.table_name, 
-                    col.name, 
-                    "hide", 
-                    new_hidden
-                )
-                st.rerun()
+                changes.append((col.name, "hide", new_hidden))
 
             # Map Schema Editor Button
             if col.cql_type.startswith("map<"):
@@ -566,6 +898,10 @@ class CassandraGUIApp:
             else:
                 cols[4].write("-")
 
+        if changes:
+            self._config.set_column_metadata_bulk(schema.keyspace, schema.table_name, changes)
+            st.rerun()
+
     def _render_map_schema_editor(self):
         """Render editor for Map column schema."""
         if 'map_editor_target' in st.session_state:
@@ -590,8 +926,9 @@ class CassandraGUIApp:
                 # Display existing keys
                 if working_copy:
                     st.write("Defined Keys:")
+                    key_col_spec = (3, 2, 1)
                     for i, item in enumerate(working_copy):
-                        c1, c2, c3 = st.columns([3, 2, 1])
+                        c1, c2, c3 = st.columns(key_col_spec)
                         c1.text_input("Key", value=item['key'], key=f"map_key_{i}", disabled=True)
                         c2.text_input("Type", value=item['type'], key=f"map_type_{i}", disabled=True)
                         if c3.button("Remove", key=f"remove_map_key_{i}"):
@@ -648,15 +985,20 @@ class CassandraGUIApp:
         keyspace = schema.keyspace
         table = schema.table_name
         
-        columns = list(data.keys())
-        placeholders = ', '.join(['%s' for _ in columns])
+        # Sort columns so identical column sets reuse one PreparedStatement.
+        columns = sorted(data.keys())
+        placeholders = ', '.join(['?' for _ in columns])
         col_names = ', '.join(columns)
-        
+
         query = f"INSERT INTO {keyspace}.{table} ({col_names}) VALUES ({placeholders})"
-        
+
         try:
-            # Note: Type conversion should be handled here
-            self._connection.execute(query, tuple(data.values()))
+            # Coerce raw form strings to each column's Python type so the
+            # driver binds typed values instead of rejecting strings.
+            values = tuple(schema.parsers[c](data[c]) for c in columns)
+            session = self._connection.session
+            session.execute(_prepared(session, query).bind(values))
+            _fetch_rows.clear()
             st.success("Record inserted successfully")
             st.rerun()
         except Exception as e:
@@ -682,10 +1024,10 @@ class CassandraGUIApp:
             final_query = query
             if extended_mode:
                 # Check for existing LIMIT
-                limit_match = re.search(r'\bLIMIT\s+(\d+)', final_query, re.IGNORECASE)
+                limit_match = _LIMIT_RE.search(final_query)
                 if limit_match:
                     st.warning(f"Extended mode overrides LIMIT {limit_match.group(1)} with LIMIT 10.")
-                    final_query = re.sub(r'\bLIMIT\s+\d+', 'LIMIT 10', final_query, flags=re.IGNORECASE)
+                    final_query = _LIMIT_RE.sub('LIMIT 10', final_query)
                 else:
                     final_query += " LIMIT 10"
             
@@ -694,11 +1036,25 @@ class CassandraGUIApp:
                 # Note: We don't use pagination here as per typical editor behavior, 
                 # but we could add it if needed. For extended mode, it's limited to 10 anyway.
                 rows = self._connection.execute(final_query)
-                data = list(rows)
-                
+
+                # Drain lazily with a safety cap instead of list(rows):
+                # the driver fetches pages on demand while iterating, so
+                # breaking early never pulls the remaining pages of an
+                # unbounded SELECT into memory.
+                data = []
+                truncated = False
+                for row in rows:
+                    data.append(row)
+                    if len(data) >= _MAX_EDITOR_ROWS:
+                        truncated = True
+                        break
+
                 if not data:
                     st.info("Query executed successfully. No results returned.")
                 else:
+                    if truncated:
+                        st.warning(f"Showing only the first {_MAX_EDITOR_ROWS} rows; "
+                                   "add a LIMIT clause to narrow the query.")
                     st.success(f"Query executed successfully. Returned {len(data)} rows.")
                     
                     if extended_mode:
@@ -712,7 +1068,28 @@ class CassandraGUIApp:
                                 st.markdown("---")
                     else:
                         # Standard Mode Rendering
-                        df = pd.DataFrame(data)
+                        import pandas as pd
+
+                        # from_records with the driver's column names skips
+                        # pandas' key-union pass over the dict rows; casting
+                        # with the driver's CQL types gives Streamlit's Arrow
+                        # serializer typed columns instead of object ones.
+                        # The metadata lives on the response future (the
+                        # ResultSet itself doesn't re-export it).
+                        future = rows.response_future
+                        col_names = getattr(future, '_col_names', None) or list(data[0].keys())
+                        col_types = getattr(future, '_col_types', None) or []
+                        df = pd.DataFrame.from_records(data, columns=col_names)
+                        dtypes = {
+                            name: _CQL_TO_PANDAS[ctype.typename]
+                            for name, ctype in zip(col_names, col_types)
+                            if getattr(ctype, 'typename', None) in _CQL_TO_PANDAS
+                        }
+                        if dtypes:
+                            try:
+                                df = df.astype(dtypes)
+                            except (TypeError, ValueError):
+                                pass  # fall back to inferred dtypes
                         st.dataframe(df, use_container_width=True)
                         
             except Exception as e:
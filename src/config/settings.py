@@ -5,13 +5,25 @@ Handles saving and loading application configuration to/from JSON file
 in the user's home directory. Auto-creates directories if missing.
 """
 
+import atexit
+import copy
 import json
+import os
+import queue
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 
+try:
+    # Optional: much faster (de)serialization than stdlib json, and the
+    # config is rewritten after every metadata change.
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ConnectionProfile:
     """Represents a saved Cassandra connection profile."""
     name: str
@@ -25,14 +37,26 @@ class ConnectionProfile:
     default_keyspace: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built explicitly: dataclasses.asdict deep-copies every field
+        # recursively, which is wasted work for these flat scalars.
+        return {
+            "name": self.name,
+            "hosts": self.hosts,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password,
+            "ssl_enabled": self.ssl_enabled,
+            "ssl_protocol": self.ssl_protocol,
+            "ssl_cert_path": self.ssl_cert_path,
+            "default_keyspace": self.default_keyspace
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "ConnectionProfile":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application settings container."""
     connections: list[ConnectionProfile] = field(default_factory=list)
@@ -78,6 +102,19 @@ class ConfigManager:
         self._config_dir = Path.home() / self.CONFIG_DIR_NAME
         self._config_file = self._config_dir / self.CONFIG_FILE_NAME
         self._settings: Optional[AppSettings] = None
+        # name -> profile index for O(1) lookups, rebuilt on load/save
+        self._profiles_by_name: Dict[str, ConnectionProfile] = {}
+        # "keyspace.table" -> frozenset of hidden column names, rebuilt on save
+        self._hidden_columns_cache: Dict[str, frozenset] = {}
+        # True when in-memory settings have mutations not yet on disk
+        self._dirty = False
+        # Disk writes happen on a background thread so a save never
+        # stalls the interactive rerun on file I/O. The queue carries
+        # plain-dict snapshots; the writer coalesces bursts into one write.
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self._close)
 
     @property
     def config_dir(self) -> Path:
@@ -98,24 +135,87 @@ class ConfigManager:
         """
         if self._config_file.exists():
             try:
-                with open(self._config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._settings = AppSettings.from_dict(data)
-            except (json.JSONDecodeError, KeyError) as e:
+                raw = self._config_file.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self._settings = AppSettings.from_dict(data)
+            except (ValueError, KeyError) as e:
                 print(f"Warning: Could not parse config file: {e}")
                 self._settings = AppSettings()
         else:
             self._settings = AppSettings()
 
+        self._profiles_by_name = {c.name: c for c in self._settings.connections}
         return self._settings
 
     def save(self, settings: AppSettings) -> None:
-        """Save settings to configuration file."""
-        self._ensure_config_dir()
+        """Save settings, handing the disk write to the background writer."""
         self._settings = settings
+        self._profiles_by_name = {c.name: c for c in settings.connections}
+        self._hidden_columns_cache.clear()
+        self._enqueue_write()
+
+    def _enqueue_write(self) -> None:
+        """Snapshot current settings and queue them for the writer thread.
+
+        A deep copy is taken on the caller's thread so later UI mutations
+        can't race the serialization happening on the writer.
+        """
+        self._write_q.put(copy.deepcopy(self._settings.to_dict()))
+        self._dirty = False
+
+    def _writer_loop(self) -> None:
+        """Drain queued snapshots and persist the newest one per burst."""
+        while True:
+            data = self._write_q.get()
+            # Coalesce: if more snapshots piled up, only the last matters.
+            stop = data is None
+            try:
+                while True:
+                    nxt = self._write_q.get_nowait()
+                    if nxt is None:
+                        stop = True
+                    else:
+                        data = nxt
+            except queue.Empty:
+                pass
+            if data is not None:
+                self._write_to_disk(data)
+            if stop:
+                return
 
-        with open(self._config_file, "w", encoding="utf-8") as f:
-            json.dump(settings.to_dict(), f, indent=2)
+    def _write_to_disk(self, data: dict) -> None:
+        """Write a settings snapshot to the config file atomically.
+
+        The content is written to a temp file and moved into place with
+        os.replace, so a crash mid-write can't leave a truncated config.
+        """
+        try:
+            self._ensure_config_dir()
+            tmp_file = self._config_file.with_suffix(".tmp")
+            if orjson:
+                tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+            os.replace(tmp_file, self._config_file)
+        except OSError as e:
+            print(f"Warning: Could not write config file: {e}")
+
+    def _mark_dirty(self) -> None:
+        """Record an in-memory mutation to be flushed to disk later."""
+        self._dirty = True
+        self._hidden_columns_cache.clear()
+
+    def flush(self) -> None:
+        """Queue pending in-memory changes for the writer, if any."""
+        if self._dirty and self._settings:
+            self._enqueue_write()
+
+    def _close(self) -> None:
+        """Flush remaining changes and stop the writer at interpreter exit."""
+        self.flush()
+        self._write_q.put(None)
+        self._writer.join(timeout=5)
 
     def get_all_connections(self) -> List[ConnectionProfile]:
         """Get all connection profiles."""
@@ -125,11 +225,7 @@ class ConfigManager:
 
     def get_connection(self, name: str) -> Optional[ConnectionProfile]:
         """Get a connection profile by name."""
-        if self._settings:
-            for conn in self._settings.connections:
-                if conn.name == name:
-                    return conn
-        return None
+        return self._profiles_by_name.get(name)
 
     def add_connection(self, connection: ConnectionProfile) -> None:
         """Add or update a connection profile."""
@@ -166,6 +262,40 @@ class ConfigManager:
         table_meta = self._settings.table_metadata.get(key, {})
         return table_meta.get(column, {})
 
+    def get_table_column_metadata(self, keyspace: str, table: str) -> Dict[str, dict]:
+        """
+        Get the full column-metadata dict for a table in one lookup.
+
+        Callers iterating many columns should fetch this once instead of
+        calling get_column_metadata per column, which rebuilds the
+        "keyspace.table" key and probes table_metadata each time.
+        """
+        if not self._settings:
+            return {}
+        return self._settings.table_metadata.get(f"{keyspace}.{table}", {})
+
+    def get_hidden_columns(self, keyspace: str, table: str) -> frozenset:
+        """
+        Get the set of hidden column names for a table.
+
+        Computed in one pass over the table's metadata and cached per
+        "keyspace.table", so callers avoid a metadata lookup per column
+        on every rerun.
+        """
+        if not self._settings:
+            return frozenset()
+
+        key = f"{keyspace}.{table}"
+        cached = self._hidden_columns_cache.get(key)
+        if cached is None:
+            table_meta = self._settings.table_metadata.get(key, {})
+            cached = frozenset(
+                column for column, meta in table_meta.items()
+                if meta.get("hide", False)
+            )
+            self._hidden_columns_cache[key] = cached
+        return cached
+
     def set_column_metadata(self, keyspace: str, table: str, column: str, key: str, value: Any) -> None:
         """Set a metadata value for a column."""
         if not self._settings:
@@ -179,4 +309,25 @@ class ConfigManager:
             self._settings.table_metadata[table_key][column] = {}
             
         self._settings.table_metadata[table_key][column][key] = value
-        self.save(self._settings)
+        self._mark_dirty()
+
+    def set_column_metadata_bulk(self, keyspace: str, table: str,
+                                 changes: List[tuple]) -> None:
+        """
+        Set metadata values for several columns with a single save.
+
+        Args:
+            changes: List of (column, key, value) tuples to apply.
+        """
+        if not changes:
+            return
+
+        if not self._settings:
+            self._settings = AppSettings()
+
+        table_key = f"{keyspace}.{table}"
+        table_meta = self._settings.table_metadata.setdefault(table_key, {})
+        for column, key, value in changes:
+            table_meta.setdefault(column, {})[key] = value
+
+        self._mark_dirty()
@@ -5,6 +5,7 @@ Handles creating, testing, and managing connections to Cassandra clusters.
 Supports authentication, SSL, and multiple hosts.
 """
 
+from collections import OrderedDict
 from typing import Optional, Callable
 from dataclasses import dataclass
 
@@ -17,15 +18,55 @@ from cassandra.cluster import (
     EXEC_PROFILE_DEFAULT
 )
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.policies import RoundRobinPolicy
-from cassandra.query import dict_factory, SimpleStatement
+from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+from cassandra.query import dict_factory, tuple_factory, SimpleStatement
+from functools import lru_cache
+import atexit
 import ssl
 
 from src.config.settings import ConnectionProfile
 from src.utils.ssl import ssl_protocol
 
 
-@dataclass
+# Name of the execution profile whose row factory yields DataFrames.
+PANDAS_PROFILE = 'pandas'
+
+# Name of the execution profile whose row factory yields plain tuples —
+# for hot loops that unpack positionally and don't want a dict per row.
+TUPLE_PROFILE = 'tuple'
+
+
+@lru_cache(maxsize=8)
+def _ssl_context(protocol_name: str, cert_path: str) -> ssl.SSLContext:
+    """Build (once) and reuse the SSLContext for a protocol/cert pair.
+
+    An SSLContext caches TLS sessions across handshakes made through it,
+    so reusing one context lets repeat connect/test cycles resume a
+    session instead of paying the full handshake every time.
+    """
+    context = ssl.SSLContext(ssl_protocol(protocol_name))
+    context.check_hostname = False
+    if cert_path:
+        context.verify_mode = ssl.CERT_REQUIRED
+        context.load_verify_locations(cert_path)
+    else:
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _pandas_factory(colnames, rows):
+    """Row factory that materializes a result page as a pandas DataFrame.
+
+    Skips the per-row dict allocation of dict_factory and hands the page
+    to pandas in columnar form directly. Used by the data-grid read path;
+    CRUD paths keep dict rows via the default profile.
+    """
+    # Imported lazily so loading this module doesn't pull in pandas.
+    import pandas as pd
+    return pd.DataFrame(rows, columns=colnames)
+
+
+@dataclass(slots=True)
 class ConnectionResult:
     """Result of a connection attempt."""
     success: bool
@@ -47,6 +88,12 @@ class CassandraConnectionManager:
         self._current_profile: Optional[ConnectionProfile] = None
         self._current_keyspace: Optional[str] = None
         self._on_disconnect_callbacks: list[Callable] = []
+        # (keyspace, CQL text) -> PreparedStatement, so repeat queries
+        # skip the driver's prepare round trip. LRU-bounded: an unbounded
+        # cache would leak statements for every distinct query ever typed
+        # into the editor.
+        self._prepared_statements: OrderedDict = OrderedDict()
+        self._prepared_statements_max = 256
 
     @property
     def is_connected(self) -> bool:
@@ -94,21 +141,36 @@ class CassandraConnectionManager:
                     password=profile.password
                 )
 
-            # Build SSL options if enabled
+            # Build SSL options if enabled. The context comes from the
+            # shared cache so reconnects can resume prior TLS sessions.
             ssl_context = None
             if profile.ssl_enabled:
-                ssl_context = ssl.SSLContext(ssl_protocol(profile.ssl_protocol))
-                ssl_context.check_hostname = False
-                if profile.ssl_cert_path:
-                    ssl_context.verify_mode = ssl.CERT_REQUIRED
-                    ssl_context.load_verify_locations(profile.ssl_cert_path)
-                else:
-                    ssl_context.verify_mode = ssl.CERT_NONE
-
-                    # Create execution profile with dict factory for easier data handling
+                ssl_context = _ssl_context(profile.ssl_protocol,
+                                           profile.ssl_cert_path or "")
+
+            # Create execution profile with dict factory for easier data handling.
+            # Token-aware routing sends each request straight to a replica for
+            # its partition instead of round-robining through coordinators.
+            # (Pool-size tuning via set_core/max_connections_per_host only
+            # applies to protocol v1/2; with v4 the driver multiplexes
+            # requests over one connection per host.)
+            # request_timeout bounds how long a stuck coordinator can hang
+            # a UI action; the driver default (10s) is kept a bit looser
+            # here to accommodate slow ALLOW FILTERING scans.
             exec_profile = ExecutionProfile(
-                load_balancing_policy=RoundRobinPolicy(),
-                row_factory=dict_factory
+                load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+                row_factory=dict_factory,
+                request_timeout=15.0
+            )
+            pandas_profile = ExecutionProfile(
+                load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+                row_factory=_pandas_factory,
+                request_timeout=15.0
+            )
+            tuple_profile = ExecutionProfile(
+                load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+                row_factory=tuple_factory,
+                request_timeout=15.0
             )
 
             # Create cluster connection
@@ -117,21 +179,24 @@ class CassandraConnectionManager:
                 port=profile.port,
                 auth_provider=auth_provider,
                 ssl_context=ssl_context,
-                execution_profiles={EXEC_PROFILE_DEFAULT: exec_profile},
+                execution_profiles={
+                    EXEC_PROFILE_DEFAULT: exec_profile,
+                    PANDAS_PROFILE: pandas_profile,
+                    TUPLE_PROFILE: tuple_profile
+                },
                 protocol_version=4
             )
 
-            # Connect to cluster
+            # Connect to cluster. Passing the keyspace here binds it during
+            # session setup, so no separate blocking USE round trip is
+            # needed afterwards.
             if profile.default_keyspace:
                 self._session = self._cluster.connect(profile.default_keyspace)
+                self._current_keyspace = profile.default_keyspace
             else:
                 self._session = self._cluster.connect()
             self._current_profile = profile
 
-            # Set default keyspace if specified
-            if profile.default_keyspace:
-                self.set_keyspace(profile.default_keyspace)
-
             return ConnectionResult(
                 success=True,
                 message=f"Connected to {', '.join(profile.hosts)}",
@@ -161,11 +226,29 @@ class CassandraConnectionManager:
 
         self._current_profile = None
         self._current_keyspace = None
+        self._prepared_statements.clear()
 
         # Notify listeners
         for callback in self._on_disconnect_callbacks:
             callback()
 
+    # Rows per server page when the caller doesn't specify one.
+    DEFAULT_FETCH_SIZE = 1000
+
+    # Warm clusters kept alive between "Test Connection" clicks, keyed by
+    # the profile fields that affect connectivity. Building a Cluster pays
+    # control-connection setup and full metadata discovery; reusing one
+    # reduces a repeat test to a single query. LRU-bounded to 4.
+    _test_clusters: OrderedDict = OrderedDict()
+    _TEST_CLUSTERS_MAX = 4
+
+    @classmethod
+    def _shutdown_test_clusters(cls) -> None:
+        """Shut down any warm test clusters (registered with atexit)."""
+        while cls._test_clusters:
+            _, (cluster, _) = cls._test_clusters.popitem()
+            cluster.shutdown()
+
     def test_connection(self, profile: ConnectionProfile) -> ConnectionResult:
         """
         Test a connection without persisting it.
@@ -176,42 +259,65 @@ class CassandraConnectionManager:
         Returns:
             ConnectionResult indicating success or failure.
         """
+        key = (tuple(profile.hosts), profile.port, profile.username,
+               profile.ssl_enabled)
         try:
-            auth_provider = None
-            if profile.username and profile.password:
-                auth_provider = PlainTextAuthProvider(
-                    username=profile.username,
-                    password=profile.password
+            cached = self._test_clusters.get(key)
+            if cached is not None:
+                self._test_clusters.move_to_end(key)
+                _, session = cached
+            else:
+                auth_provider = None
+                if profile.username and profile.password:
+                    auth_provider = PlainTextAuthProvider(
+                        username=profile.username,
+                        password=profile.password
+                    )
+
+                # Share the cached context with connect() so a test followed
+                # by a real connect reuses the same TLS session cache.
+                ssl_context = None
+                if profile.ssl_enabled:
+                    ssl_context = _ssl_context(profile.ssl_protocol,
+                                               profile.ssl_cert_path or "")
+
+                cluster = Cluster(
+                    contact_points=profile.hosts,
+                    port=profile.port,
+                    auth_provider=auth_provider,
+                    ssl_context=ssl_context,
+                    execution_profiles={
+                        EXEC_PROFILE_DEFAULT: ExecutionProfile(
+                            load_balancing_policy=TokenAwarePolicy(
+                                DCAwareRoundRobinPolicy()
+                            )
+                        )
+                    },
+                    protocol_version=4
                 )
-
-            ssl_context = None
-            if profile.ssl_enabled:
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-            cluster = Cluster(
-                contact_points=profile.hosts,
-                port=profile.port,
-                auth_provider=auth_provider,
-                ssl_context=ssl_context,
-                protocol_version=4
-            )
-
-            session = cluster.connect()
+                session = cluster.connect()
+                self._test_clusters[key] = (cluster, session)
+                if len(self._test_clusters) > self._TEST_CLUSTERS_MAX:
+                    _, (old_cluster, _) = self._test_clusters.popitem(last=False)
+                    old_cluster.shutdown()
 
             # Run a simple query to verify connection
             session.execute("SELECT release_version FROM system.local")
 
-            session.shutdown()
-            cluster.shutdown()
-
             return ConnectionResult(
                 success=True,
                 message="Connection test successful!"
             )
 
         except Exception as e:
+            # A cached cluster that stopped answering is useless; drop it
+            # so the next test starts clean.
+            stale = self._test_clusters.pop(key, None)
+            if stale is not None:
+                try:
+                    stale[0].shutdown()
+                except Exception:
+                    pass
             return ConnectionResult(
                 success=False,
                 message=f"Connection test failed: {str(e)}"
@@ -228,13 +334,38 @@ class CassandraConnectionManager:
             self._session.set_keyspace(keyspace)
             self._current_keyspace = keyspace
 
+    def set_keyspace_async(self, keyspace: str):
+        """
+        Switch keyspace without blocking the caller.
+
+        Submits the USE statement asynchronously so callers can overlap
+        the round trip with other work and only wait on the returned
+        future when the switch must be visible.
+
+        Args:
+            keyspace: Name of the keyspace to use.
+
+        Returns:
+            The ResponseFuture for the USE statement, or None when
+            there is no active session.
+        """
+        if not self._session:
+            return None
+        future = self._session.execute_async(f"USE {keyspace}")
+        self._current_keyspace = keyspace
+        return future
+
     def execute(self, query: str, parameters: tuple = None, page_size: int = None, paging_state: bytes = None):
         """
         Execute a CQL query.
 
         Args:
-            query: CQL query string.
-            parameters: Optional tuple of parameters for prepared statement.
+            query: CQL query string. When parameters are supplied this must
+                be parametrized CQL with `?` placeholders (never values
+                pre-formatted into the text), so the statement cache stays
+                keyed by query shape.
+            parameters: Optional tuple of parameters bound against the
+                cached PreparedStatement.
             page_size: Number of rows to fetch (fetch_size).
             paging_state: State string to resume pagination.
 
@@ -244,15 +375,61 @@ class CassandraConnectionManager:
         if not self._session:
             raise RuntimeError("No active connection")
 
+        # Without an explicit page_size, page at 1000 rows so a single
+        # result page has a predictable memory ceiling (the driver default
+        # of 5000 over-fetches for interactive browsing).
         if parameters:
-            prepared = self._session.prepare(query)
+            prepared = self._prepare(query)
             bound = prepared.bind(parameters)
             bound.consistency_level = ConsistencyLevel.ONE
-            if page_size:
-                bound.fetch_size = page_size
+            bound.fetch_size = page_size or self.DEFAULT_FETCH_SIZE
             return self._session.execute(bound, paging_state=paging_state)
         else:
             statement = SimpleStatement(query, consistency_level=ConsistencyLevel.ONE)
-            if page_size:
-                statement.fetch_size = page_size
+            statement.fetch_size = page_size or self.DEFAULT_FETCH_SIZE
             return self._session.execute(statement, paging_state=paging_state)
+
+    def execute_paged(self, query: str, parameters: tuple = None,
+                      fetch_size: int = None):
+        """
+        Execute a CQL query and return the lazily-paging ResultSet.
+
+        The returned iterator pulls further pages from the server only as
+        it is advanced (has_more_pages / fetch_next_page), so callers can
+        stream arbitrarily large results with one page resident at a time.
+
+        Args:
+            query: CQL query string (with `?` placeholders if parametrized).
+            parameters: Optional tuple of bind parameters.
+            fetch_size: Rows per server page (defaults to 1000).
+
+        Returns:
+            The driver ResultSet iterator.
+        """
+        return self.execute(query, parameters,
+                            page_size=fetch_size or self.DEFAULT_FETCH_SIZE)
+
+    def _prepare(self, query: str):
+        """
+        Prepare a statement once per (keyspace, CQL text) for this session.
+
+        Callers must pass parametrized CQL with `?` placeholders so the
+        cache key space stays bounded by the number of distinct query
+        shapes, not by the values interpolated into them. The keyspace is
+        part of the key because unqualified table names resolve against
+        the keyspace active at prepare time. Least-recently-used entries
+        are evicted past the capacity limit.
+        """
+        key = (self._current_keyspace, query)
+        prepared = self._prepared_statements.get(key)
+        if prepared is None:
+            prepared = self._session.prepare(query)
+            self._prepared_statements[key] = prepared
+            if len(self._prepared_statements) > self._prepared_statements_max:
+                self._prepared_statements.popitem(last=False)
+        else:
+            self._prepared_statements.move_to_end(key)
+        return prepared
+
+
+atexit.register(CassandraConnectionManager._shutdown_test_clusters)
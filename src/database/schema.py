@@ -6,11 +6,58 @@ Provides structured information about table schemas including
 partition keys, clustering keys, and column types.
 """
 
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
 from cassandra.cluster import Session
+from cassandra.concurrent import execute_concurrent_with_args
+
+from src.database.connection import TUPLE_PROFILE
+from src.utils.type_mapping import convert_value_base, parse_cql_type
+
+
+# System-schema queries as module-level constants: each is built and
+# interned once, and the connection manager's prepared-statement cache
+# keys on the exact text, so every method call hashes the same string.
+_Q_KEYSPACES = """
+    SELECT keyspace_name
+    FROM system_schema.keyspaces
+"""
+_Q_TABLES = """
+    SELECT table_name
+    FROM system_schema.tables
+    WHERE keyspace_name = %s
+"""
+_Q_COLUMNS = """
+    SELECT table_name, column_name, type, kind, position, clustering_order
+    FROM system_schema.columns
+    WHERE keyspace_name = %s
+"""
+# Prepared (bind-marker) variant for single-table fetches issued
+# concurrently by get_many_schemas.
+_Q_COLUMNS_ONE = """
+    SELECT column_name, type, kind, position, clustering_order
+    FROM system_schema.columns
+    WHERE keyspace_name = ? AND table_name = ?
+"""
+_Q_SIZE_ESTIMATES = """
+    SELECT partitions_count
+    FROM system.size_estimates
+    WHERE keyspace_name = %s AND table_name = %s
+"""
+
+
+# Cassandra's internal keyspaces all share the system* prefix, so the
+# keyspace list filters by prefix instead of a hardcoded enumeration that
+# goes stale when new system_* keyspaces appear. Keyspaces named here are
+# shown despite matching the prefix.
+_NON_SYSTEM_EXCEPTIONS: frozenset = frozenset()
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnInfo:
     """Information about a single column."""
     name: str
@@ -19,6 +66,12 @@ class ColumnInfo:
     is_clustering_key: bool = False
     clustering_order: str = "ASC"
     position: int = 0
+    # Parsed once at schema load so per-value hot paths (cell rendering,
+    # form conversion) never re-parse the type string.
+    base_type: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.base_type = parse_cql_type(self.cql_type)[0]
 
     @property
     def is_primary_key(self) -> bool:
@@ -26,49 +79,61 @@ class ColumnInfo:
         return self.is_partition_key or self.is_clustering_key
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSchema:
-    """Complete schema information for a table."""
+    """Complete schema information for a table.
+
+    The column set is immutable once built (schema changes produce a
+    fresh TableSchema), so every derived view — name lookup dict, key
+    groupings, delete CQL, per-column parsers — is computed once in
+    __post_init__. They are declared as fields (rather than using
+    cached_property) so the class can carry slots=True: a large keyspace
+    materializes many of these, and UI code reads the derived views once
+    per column per repaint.
+    """
     keyspace: str
     table_name: str
     columns: list[ColumnInfo] = field(default_factory=list)
 
-    def column(self, name: str) -> ColumnInfo | None:
-        for c in self.columns:
-            if c.name == name:
-                return c
-        return None
-
-    @property
-    def partition_keys(self) -> list[ColumnInfo]:
-        """Get partition key columns in order."""
-        return sorted(
+    # Derived views, populated in __post_init__.
+    partition_keys: list[ColumnInfo] = field(init=False, repr=False, compare=False)
+    clustering_keys: list[ColumnInfo] = field(init=False, repr=False, compare=False)
+    primary_key_columns: list[ColumnInfo] = field(init=False, repr=False, compare=False)
+    regular_columns: list[ColumnInfo] = field(init=False, repr=False, compare=False)
+    all_columns_sorted: list[ColumnInfo] = field(init=False, repr=False, compare=False)
+    primary_key_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    delete_cql: str = field(init=False, repr=False, compare=False)
+    parsers: dict[str, Callable[[Any], Any]] = field(init=False, repr=False, compare=False)
+    _columns_by_name: dict[str, ColumnInfo] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._columns_by_name = {c.name: c for c in self.columns}
+        self.partition_keys = sorted(
             [c for c in self.columns if c.is_partition_key],
             key=lambda c: c.position
         )
-
-    @property
-    def clustering_keys(self) -> list[ColumnInfo]:
-        """Get clustering key columns in order."""
-        return sorted(
+        self.clustering_keys = sorted(
             [c for c in self.columns if c.is_clustering_key],
             key=lambda c: c.position
         )
+        self.primary_key_columns = self.partition_keys + self.clustering_keys
+        self.regular_columns = [c for c in self.columns if not c.is_primary_key]
+        self.all_columns_sorted = self.primary_key_columns + self.regular_columns
+        self.primary_key_names = tuple(c.name for c in self.primary_key_columns)
+        # delete_cql is schema-invariant, so building it once per schema
+        # lets delete calls go straight to a cached PreparedStatement bind.
+        where = " AND ".join(f"{n} = ?" for n in self.primary_key_names)
+        self.delete_cql = f"DELETE FROM {self.keyspace}.{self.table_name} WHERE {where}"
+        # parsers maps column name to a callable coercing raw (usually
+        # string) input to the Python type the driver expects; partials
+        # (not lambdas) keep the schema picklable for st.cache_data.
+        self.parsers = {
+            c.name: partial(convert_value_base, base_type=c.base_type)
+            for c in self.columns
+        }
 
-    @property
-    def primary_key_columns(self) -> list[ColumnInfo]:
-        """Get all primary key columns (partition + clustering)."""
-        return self.partition_keys + self.clustering_keys
-
-    @property
-    def regular_columns(self) -> list[ColumnInfo]:
-        """Get non-primary-key columns."""
-        return [c for c in self.columns if not c.is_primary_key]
-
-    @property
-    def all_columns_sorted(self) -> list[ColumnInfo]:
-        """Get all columns with primary keys first."""
-        return self.primary_key_columns + self.regular_columns
+    def column(self, name: str) -> ColumnInfo | None:
+        return self._columns_by_name.get(name)
 
 
 # noinspection SqlNoDataSourceInspection
@@ -81,6 +146,10 @@ class SchemaInspector:
     at runtime to handle schema changes gracefully.
     """
 
+    # Bounds for the table-schema cache.
+    SCHEMA_CACHE_MAX = 512
+    SCHEMA_TTL = 30.0  # seconds
+
     def __init__(self, session: Session):
         """
         Initialize schema inspector.
@@ -90,6 +159,55 @@ class SchemaInspector:
         """
         self._session = session
 
+        # Memoized lookups, populated lazily on first access. The GUI
+        # re-queries schema metadata on every rerun; without these caches
+        # each rerun costs 2-3 round trips to system_schema. Table schemas
+        # live in a bounded LRU with a TTL so a long session against a
+        # huge cluster can neither grow without bound nor serve schemas
+        # that drifted after DDL elsewhere.
+        self._keyspaces: list[str] | None = None
+        self._tables_by_ks: dict[str, list[str]] = {}
+        self._schema_cache: OrderedDict[tuple[str, str], tuple[float, TableSchema]] = OrderedDict()
+        # Prepared lazily for get_many_schemas' concurrent fetches.
+        self._columns_stmt = None
+
+    def invalidate(self, keyspace: str = None, table: str = None) -> None:
+        """
+        Drop memoized metadata so the next lookup refetches from Cassandra.
+
+        Args:
+            keyspace: If given, only this keyspace's entries are dropped.
+            table: If given with keyspace, only that table's schema.
+        """
+        if keyspace is None:
+            self._keyspaces = None
+            self._tables_by_ks.clear()
+            self._schema_cache.clear()
+        elif table is None:
+            self._tables_by_ks.pop(keyspace, None)
+            for key in [k for k in self._schema_cache if k[0] == keyspace]:
+                del self._schema_cache[key]
+        else:
+            self._schema_cache.pop((keyspace, table), None)
+
+    def _cache_get(self, keyspace: str, table: str) -> TableSchema | None:
+        """Return a cached schema if present and fresh, else None."""
+        entry = self._schema_cache.get((keyspace, table))
+        if entry is None:
+            return None
+        fetched_at, schema = entry
+        if time.monotonic() - fetched_at > self.SCHEMA_TTL:
+            del self._schema_cache[(keyspace, table)]
+            return None
+        self._schema_cache.move_to_end((keyspace, table))
+        return schema
+
+    def _cache_put(self, keyspace: str, table: str, schema: TableSchema) -> None:
+        """Insert a schema, evicting the least recently used past capacity."""
+        self._schema_cache[(keyspace, table)] = (time.monotonic(), schema)
+        if len(self._schema_cache) > self.SCHEMA_CACHE_MAX:
+            self._schema_cache.popitem(last=False)
+
     def get_keyspaces(self) -> list[str]:
         """
         Get list of all keyspaces.
@@ -97,24 +215,18 @@ class SchemaInspector:
         Returns:
             List of keyspace names, excluding system keyspaces.
         """
-        query = """
-            SELECT keyspace_name 
-            FROM system_schema.keyspaces
-        """
-        rows = self._session.execute(query)
+        if self._keyspaces is not None:
+            return self._keyspaces
 
-        # Filter out system keyspaces
-        system_keyspaces = {
-            'system', 'system_auth', 'system_schema',
-            'system_distributed', 'system_traces', 'system_views',
-            'system_virtual_schema'
-        }
+        rows = self._session.execute(_Q_KEYSPACES)
 
-        return sorted([
+        self._keyspaces = sorted([
             row['keyspace_name']
             for row in rows
-            if row['keyspace_name'] not in system_keyspaces
-        ])
+            if not row['keyspace_name'].startswith('system')
+            or row['keyspace_name'] in _NON_SYSTEM_EXCEPTIONS
+        ], key=str.casefold)
+        return self._keyspaces
 
     def get_tables(self, keyspace: str) -> list[str]:
         """
@@ -126,21 +238,63 @@ class SchemaInspector:
         Returns:
             List of table names.
         """
-        query = """
-            SELECT table_name 
-            FROM system_schema.tables 
-            WHERE keyspace_name = %s
+        if keyspace in self._tables_by_ks:
+            return self._tables_by_ks[keyspace]
+
+        rows = self._session.execute(_Q_TABLES, (keyspace,))
+        self._tables_by_ks[keyspace] = sorted(
+            [row['table_name'] for row in rows], key=str.casefold
+        )
+        return self._tables_by_ks[keyspace]
+
+    def get_all_table_schemas(self, keyspace: str) -> dict[str, TableSchema]:
+        """
+        Get schemas for every table in a keyspace with a single query.
+
+        Fetching per table costs one round trip each; one bounded query
+        over system_schema.columns covers the whole keyspace, and the
+        results are memoized so later per-table lookups are free.
+
+        Args:
+            keyspace: Name of the keyspace.
+
+        Returns:
+            Dict mapping table name to its TableSchema.
         """
-        rows = self._session.execute(query, (keyspace,))
-        return sorted([row['table_name'] for row in rows])
+        # Tuple rows unpack positionally in the loop below — six dict
+        # hashes fewer per column than dict_factory rows, which adds up
+        # on keyspaces with thousands of columns.
+        rows = self._session.execute(_Q_COLUMNS, (keyspace,),
+                                     execution_profile=TUPLE_PROFILE)
+
+        columns_by_table: dict[str, list[ColumnInfo]] = defaultdict(list)
+        # kind can be: partition_key, clustering, regular, static
+        for table_name, column_name, cql_type, kind, position, corder in rows:
+            columns_by_table[table_name].append(ColumnInfo(
+                name=column_name,
+                cql_type=cql_type,
+                is_partition_key=kind == 'partition_key',
+                is_clustering_key=kind == 'clustering',
+                clustering_order=corder or 'ASC',
+                position=position
+            ))
+
+        schemas = {
+            table: TableSchema(keyspace=keyspace, table_name=table, columns=cols)
+            for table, cols in columns_by_table.items()
+        }
+        for table, schema in schemas.items():
+            self._cache_put(keyspace, table, schema)
+        return schemas
 
     def get_table_schema(self, keyspace: str, table: str) -> TableSchema:
         """
         Get complete schema information for a table.
 
-        This method queries system_schema.columns to get all column
-        information including types, and determines partition/clustering
-        keys from the column kind field.
+        On a cache miss the whole keyspace is fetched in one query via
+        get_all_table_schemas — selecting any table in a keyspace makes
+        every other table in it free — and this method is a thin lookup
+        over that memoized result.
 
         Args:
             keyspace: Name of the keyspace.
@@ -149,40 +303,80 @@ class SchemaInspector:
         Returns:
             TableSchema with complete column information.
         """
-        # Query column information from system schema
-        query = """
-            SELECT column_name, type, kind, position, clustering_order
-            FROM system_schema.columns
-            WHERE keyspace_name = %s AND table_name = %s
-        """
-        rows = self._session.execute(query, (keyspace, table))
-
-        columns = []
-        for row in rows:
-            # Determine column role from 'kind' field
-            # kind can be: partition_key, clustering, regular, static
-            is_partition = row['kind'] == 'partition_key'
-            is_clustering = row['kind'] == 'clustering'
-
-            column = ColumnInfo(
-                name=row['column_name'],
-                cql_type=row['type'],
-                is_partition_key=is_partition,
-                is_clustering_key=is_clustering,
-                clustering_order=row.get('clustering_order', 'ASC') or 'ASC',
-                position=row['position']
-            )
-            columns.append(column)
-
-        return TableSchema(
-            keyspace=keyspace,
-            table_name=table,
-            columns=columns
+        cached = self._cache_get(keyspace, table)
+        if cached is not None:
+            return cached
+
+        schema = self.get_all_table_schemas(keyspace).get(table)
+        if schema is None:
+            # Unknown (or just-created) table: keep the previous behavior
+            # of returning an empty schema rather than raising.
+            schema = TableSchema(keyspace=keyspace, table_name=table, columns=[])
+            self._cache_put(keyspace, table, schema)
+        return schema
+
+    def get_many_schemas(self, pairs: list[tuple[str, str]],
+                         concurrency: int = 64) -> dict[tuple[str, str], TableSchema]:
+        """
+        Fetch schemas for many (keyspace, table) pairs concurrently.
+
+        Cached entries are served directly; the misses are fetched via
+        execute_concurrent_with_args against one prepared statement, so
+        warmup time scales with cluster concurrency rather than table
+        count. Pairs whose fetch fails are omitted from the result.
+
+        Args:
+            pairs: (keyspace, table) pairs to resolve.
+            concurrency: Maximum in-flight requests.
+
+        Returns:
+            Dict mapping (keyspace, table) to its TableSchema.
+        """
+        schemas: dict[tuple[str, str], TableSchema] = {}
+        missing = []
+        for keyspace, table in pairs:
+            cached = self._cache_get(keyspace, table)
+            if cached is not None:
+                schemas[(keyspace, table)] = cached
+            else:
+                missing.append((keyspace, table))
+
+        if not missing:
+            return schemas
+
+        if self._columns_stmt is None:
+            self._columns_stmt = self._session.prepare(_Q_COLUMNS_ONE)
+
+        results = execute_concurrent_with_args(
+            self._session, self._columns_stmt, missing, concurrency=concurrency
         )
+        for (keyspace, table), (success, rows) in zip(missing, results):
+            if not success:
+                continue
+            columns = [
+                ColumnInfo(
+                    name=row['column_name'],
+                    cql_type=row['type'],
+                    is_partition_key=row['kind'] == 'partition_key',
+                    is_clustering_key=row['kind'] == 'clustering',
+                    clustering_order=row['clustering_order'] or 'ASC',
+                    position=row['position']
+                )
+                for row in rows
+            ]
+            schema = TableSchema(keyspace=keyspace, table_name=table, columns=columns)
+            self._cache_put(keyspace, table, schema)
+            schemas[(keyspace, table)] = schema
+        return schemas
 
     def get_row_count_estimate(self, keyspace: str, table: str) -> int:
         """
-        Get estimated row count for a table.
+        Get estimated partition count for a table.
+
+        Reads system.size_estimates, which compaction maintains offline,
+        instead of running COUNT(*) — a coordinator-side scatter/gather
+        scan whose LIMIT also clipped the answer at 10000. One row is
+        returned per token range, so the counts are summed.
 
         Note: This is an estimate and may not be accurate for large tables.
 
@@ -194,7 +388,12 @@ class SchemaInspector:
             Estimated row count.
         """
         try:
-            # This query can be slow on large tables
+            rows = list(self._session.execute(_Q_SIZE_ESTIMATES, (keyspace, table)))
+            if rows:
+                return sum(row['partitions_count'] for row in rows)
+
+            # No estimate yet (e.g. freshly created table): fall back to
+            # the bounded scan.
             query = f"SELECT COUNT(*) as count FROM {keyspace}.{table} LIMIT 10000"
             result = self._session.execute(query)
             row = result.one()
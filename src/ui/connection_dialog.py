@@ -5,17 +5,47 @@ Provides a dialog for creating, editing, and testing Cassandra connections.
 Supports multiple hosts, authentication, and SSL configuration.
 """
 
+import re
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QSpinBox, QCheckBox, QPushButton,
     QLabel, QMessageBox, QTextEdit, QGroupBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 
 from src.config.settings import ConnectionProfile
 from src.database.connection import CassandraConnectionManager
 
 
+# Splits the hosts textarea on any run of whitespace or commas, so
+# newline-, CRLF- and comma-separated host lists all parse in one pass.
+_HOSTS_SPLIT = re.compile(r"[\s,]+")
+
+
+class _TestConnRunnable(QRunnable):
+    """Run a connection test on the global thread pool.
+
+    The driver's connect timeout can block for tens of seconds on an
+    unreachable host; doing that on a worker keeps the event loop alive
+    instead of freezing the dialog behind processEvents().
+    """
+
+    class Signals(QObject):
+        result_ready = Signal(object)
+
+    def __init__(self, manager: CassandraConnectionManager,
+                 profile: ConnectionProfile):
+        super().__init__()
+        self._manager = manager
+        self._profile = profile
+        self.signals = self.Signals()
+
+    def run(self):
+        result = self._manager.test_connection(self._profile)
+        self.signals.result_ready.emit(result)
+
+
 class ConnectionDialog(QDialog):
     """
     Dialog for managing Cassandra connection profiles.
@@ -34,7 +64,12 @@ class ConnectionDialog(QDialog):
         """
         super().__init__(parent)
         self._profile = profile
-        self._connection_manager = CassandraConnectionManager()
+        # Built lazily: most dialogs are saved or cancelled without ever
+        # testing, so they shouldn't pay for a connection manager.
+        self._connection_manager: CassandraConnectionManager = None
+        # Profile built from the form when the dialog is accepted, so
+        # validation and get_profile() agree and the form is parsed once.
+        self._built_profile: ConnectionProfile = None
 
         self._setup_ui()
         self._load_profile()
@@ -139,8 +174,8 @@ class ConnectionDialog(QDialog):
 
     def _get_profile_from_form(self) -> ConnectionProfile:
         """Create a ConnectionProfile from form data."""
-        hosts_text = self.hosts_input.toPlainText().strip()
-        hosts = [h.strip() for h in hosts_text.split("\n") if h.strip()]
+        hosts_text = self.hosts_input.toPlainText()
+        hosts = [h for h in _HOSTS_SPLIT.split(hosts_text) if h]
 
         if not hosts:
             hosts = ["127.0.0.1"]
@@ -156,18 +191,20 @@ class ConnectionDialog(QDialog):
         )
 
     def _test_connection(self):
-        """Test the connection with current settings."""
+        """Test the connection with current settings, off the event loop."""
         profile = self._get_profile_from_form()
 
         self.test_button.setText("Testing...")
         self.test_button.setEnabled(False)
 
-        # Force UI update
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
-
-        result = self._connection_manager.test_connection(profile)
+        if self._connection_manager is None:
+            self._connection_manager = CassandraConnectionManager()
+        runnable = _TestConnRunnable(self._connection_manager, profile)
+        runnable.signals.result_ready.connect(self._on_test_result)
+        QThreadPool.globalInstance().start(runnable)
 
+    def _on_test_result(self, result):
+        """Show the outcome of a background connection test."""
         self.test_button.setText("Test Connection")
         self.test_button.setEnabled(True)
 
@@ -206,8 +243,11 @@ class ConnectionDialog(QDialog):
             self.hosts_input.setFocus()
             return
 
+        self._built_profile = self._get_profile_from_form()
         self.accept()
 
     def get_profile(self) -> ConnectionProfile:
         """Get the configured connection profile."""
+        if self._built_profile is not None:
+            return self._built_profile
         return self._get_profile_from_form()
\ No newline at end of file
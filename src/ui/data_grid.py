@@ -7,14 +7,154 @@ Supports filtering, selection, and CRUD operations.
 
 from typing import Optional, Callable
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QLineEdit,
-    QSpinBox, QHeaderView, QMessageBox, QComboBox
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QPushButton, QLabel, QLineEdit, QSpinBox, QHeaderView,
+    QMessageBox, QComboBox, QStyle, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QAbstractTableModel, QModelIndex, QTimer
+)
+from PySide6.QtGui import QFont, QPainter, QPixmap, QPixmapCache
 
 from src.database.schema import TableSchema
-from src.utils.type_mapping import format_value_for_display
+from src.utils.type_mapping import (
+    format_value_for_display, format_value_for_display_base)
+
+# Base CQL types whose display strings are long enough that text layout
+# dominates paint time; these columns get the pixmap-cached delegate.
+_HEAVY_DELEGATE_TYPES = frozenset(
+    ('blob', 'frozen', 'list', 'set', 'map', 'tuple'))
+
+
+class BlobDelegate(QStyledItemDelegate):
+    """
+    Paints long cell text (blobs, collections, frozen UDTs) from a
+    cached QPixmap.
+
+    Laying out a multi-hundred-character string costs far more than
+    blitting a pixmap, and the same values scroll past repeatedly, so
+    each rendering is keyed by content and cell size in QPixmapCache
+    and reused on subsequent paints. Content keying means edits never
+    serve stale pixmaps.
+    """
+
+    def paint(self, painter, option, index):
+        text = index.data(Qt.DisplayRole)
+        # Selected cells keep the style's highlight; short/empty text is
+        # cheap to lay out directly.
+        if not text or option.state & QStyle.State_Selected:
+            super().paint(painter, option, index)
+            return
+
+        rect = option.rect
+        key = f"cell:{hash(text)}:{rect.width()}x{rect.height()}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = QPixmap(rect.size())
+            pixmap.fill(Qt.transparent)
+            cell_painter = QPainter(pixmap)
+            cell_painter.setFont(option.font)
+            cell_painter.setPen(option.palette.text().color())
+            cell_painter.drawText(
+                pixmap.rect().adjusted(4, 0, -4, 0),
+                Qt.AlignVCenter | Qt.TextSingleLine,
+                text,
+            )
+            cell_painter.end()
+            QPixmapCache.insert(key, pixmap)
+
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a page of Cassandra records.
+
+    The model holds references to the record list and column metadata
+    and formats values on demand in data(), so the view only pays for
+    the cells it actually paints instead of one item per cell upfront.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records: list[dict] = []
+        self._columns: list = []
+        # Per-column arrays hoisted from the ColumnInfo objects so
+        # data() — called once per visible cell per repaint — does
+        # plain list indexing instead of attribute/property lookups.
+        self._col_names: list[str] = []
+        self._col_base_types: list[str] = []
+        self._pk_mask: list[bool] = []
+        # One shared bold font for primary key cells, built lazily so
+        # the model can be constructed before the QApplication.
+        self._bold_font: Optional[QFont] = None
+
+    def set_columns(self, columns: list) -> None:
+        """Replace the column metadata (on schema change)."""
+        self.beginResetModel()
+        self._columns = list(columns)
+        self._col_names = [col.name for col in self._columns]
+        self._col_base_types = [col.base_type for col in self._columns]
+        self._pk_mask = [col.is_primary_key for col in self._columns]
+        self.endResetModel()
+
+    def set_records(self, records: list[dict]) -> None:
+        """Replace the displayed records (on page/filter change)."""
+        self.beginResetModel()
+        self._records = records
+        self.endResetModel()
+
+    def append_rows(self, new_records: list[dict]) -> None:
+        """
+        Append records below the existing ones.
+
+        Uses beginInsertRows/endInsertRows so the view keeps its
+        selection, scroll position, and geometry caches instead of the
+        full relayout a model reset would force.
+        """
+        if not new_records:
+            return
+        start = len(self._records)
+        self.beginInsertRows(QModelIndex(), start,
+                             start + len(new_records) - 1)
+        self._records.extend(new_records)
+        self.endInsertRows()
+
+    def record_at(self, row: int) -> Optional[dict]:
+        """Get the record backing a view row, or None if out of range."""
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._col_names[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        col = index.column()
+        value = self._records[index.row()].get(self._col_names[col])
+
+        if role == Qt.DisplayRole:
+            return format_value_for_display_base(
+                value, self._col_base_types[col])
+        if role == Qt.UserRole:
+            return value
+        if role == Qt.FontRole and self._pk_mask[col]:
+            if self._bold_font is None:
+                self._bold_font = QFont()
+                self._bold_font.setBold(True)
+            return self._bold_font
+        return None
 
 
 class DataGrid(QWidget):
@@ -33,15 +173,44 @@ class DataGrid(QWidget):
     edit_requested = Signal(dict)  # Emits record to edit
     delete_requested = Signal(dict)  # Emits record to delete
     refresh_requested = Signal()
-    filter_changed = Signal(dict)  # Emits filter parameters
+    # Emits (column, bind_values) so callers can cache one prepared
+    # statement per column and rebind values; an empty column means the
+    # filter was cleared. Partition-key equality binds then route
+    # token-aware to the owning replica.
+    filter_changed = Signal(str, tuple)
+    loading_changed = Signal(bool)  # True while a fetch is in flight
+    # Emitted with the next page's paging state once a page is shown;
+    # callers kick off execute_async and hand the future back through
+    # set_prefetch so Next usually hits an already-finished query.
+    prefetch_requested = Signal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._schema: Optional[TableSchema] = None
         self._records: list[dict] = []
-        self._page = 0
+        # Server-side pagination: each entry is the opaque paging state
+        # used to fetch the corresponding visited page (None for the
+        # first). The top of the stack fetched the current page, so
+        # Previous is a pop and Next pushes the state the server
+        # returned with this page — constant-time at any depth, unlike
+        # OFFSET-style skipping.
+        self._paging_stack: list[Optional[bytes]] = [None]
+        self._next_paging_state: Optional[bytes] = None
         self._page_size = 50
         self._total_records = 0
+        # Fetch-size ramp: the first fetch after opening a table or
+        # changing a filter asks for a small row count so the first
+        # screenful paints almost immediately, then doubles per fetch
+        # until it reaches the user-set page size.
+        self._initial_fetch_size = 10
+        self._fetch_step = 0
+        self._loading = False
+        # In-flight execute_async future for the next page, if any.
+        self._prefetch_future = None
+        # Cheap identity check for the displayed page: row count plus
+        # the first and last rows' primary key values. A Refresh that
+        # returns the same page skips the model reset entirely.
+        self._data_fingerprint: Optional[tuple] = None
 
         self._setup_ui()
 
@@ -65,6 +234,13 @@ class DataGrid(QWidget):
         self.filter_input.setPlaceholderText("Enter value...")
         self.filter_input.setMaximumWidth(200)
         self.filter_input.returnPressed.connect(self._apply_filter)
+        # Debounce live typing: restart the timer on every keystroke so
+        # a query fires once per pause instead of once per character.
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(300)
+        self._filter_debounce.timeout.connect(self._apply_filter)
+        self.filter_input.textChanged.connect(self._filter_debounce.start)
         toolbar.addWidget(self.filter_input)
 
         self.filter_button = QPushButton("Filter")
@@ -104,18 +280,35 @@ class DataGrid(QWidget):
         layout.addLayout(toolbar)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self._model = RecordTableModel(self)
+        # The grid and model share one record list so appends through
+        # the model are visible here without copying.
+        self._model.set_records(self._records)
+        self.table = QTableView()
+        self.table.setModel(self._model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
         self.table.setAlternatingRowColors(True)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.cellDoubleClicked.connect(self._on_double_click)
+        self.table.selectionModel().selectionChanged.connect(
+            self._on_selection_changed)
+        self.table.doubleClicked.connect(self._on_double_click)
 
         # Configure header
         header = self.table.horizontalHeader()
         header.setStretchLastSection(True)
         header.setSectionResizeMode(QHeaderView.Interactive)
 
+        # Uniform row heights: skip per-row size-hint queries during
+        # layout and scrolling.
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(28)
+
+        # One shared delegate for heavy columns; set_schema decides
+        # which columns it applies to.
+        self._blob_delegate = BlobDelegate(self.table)
+        self._delegate_columns: list[int] = []
+
         layout.addWidget(self.table)
 
         # Pagination
@@ -157,94 +350,176 @@ class DataGrid(QWidget):
         """
         self._schema = schema
 
+        # Column types may differ from the previous table; drop memoized
+        # display strings so stale formatting can't leak across schemas.
+        format_value_for_display.cache_clear()
+
+        # A new table starts over at page one with a small first fetch.
+        self._reset_paging()
+
         # Update filter column dropdown
         self.filter_column.clear()
         for col in schema.partition_keys:
             self.filter_column.addItem(col.name)
 
         # Set up table columns
-        columns = schema.all_columns_sorted
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels([col.name for col in columns])
+        self._model.set_columns(schema.all_columns_sorted)
+
+        # Route heavy columns through the pixmap-cached delegate and
+        # restore the default delegate on columns from the old schema.
+        for col_idx in self._delegate_columns:
+            self.table.setItemDelegateForColumn(col_idx, None)
+        self._delegate_columns = [
+            idx for idx, col in enumerate(schema.all_columns_sorted)
+            if col.base_type in _HEAVY_DELEGATE_TYPES
+        ]
+        for col_idx in self._delegate_columns:
+            self.table.setItemDelegateForColumn(col_idx, self._blob_delegate)
+
+    def set_loading(self, loading: bool) -> None:
+        """
+        Mark a fetch as in flight (or finished).
 
-    def set_data(self, records: list[dict], total_count: int = None) -> None:
+        Callers running queries through execute_async set this before
+        dispatch; the grid locks its fetch-triggering buttons so a slow
+        query can't be stacked, and re-enables them when data lands.
+        """
+        self._loading = loading
+        self.refresh_button.setEnabled(not loading)
+        if loading:
+            self.prev_button.setEnabled(False)
+            self.next_button.setEnabled(False)
+        else:
+            self._update_pagination()
+        self.loading_changed.emit(loading)
+
+    @Slot(list)
+    @Slot(list, object)
+    @Slot(list, object, object)
+    def set_data(self, records: list[dict], total_count: int = None,
+                 paging_state: Optional[bytes] = None) -> None:
         """
         Set the grid data.
 
+        Registered as a slot so async callers can deliver results from
+        driver callback threads with QMetaObject.invokeMethod and a
+        queued connection.
+
         Args:
             records: List of record dictionaries.
             total_count: Total number of records (for pagination info).
+            paging_state: Opaque driver state for fetching the next
+                page, or None when this page is the last.
         """
-        self._records = records
         self._total_records = total_count or len(records)
+        self._next_paging_state = paging_state
+        if self.effective_fetch_size() < self._page_size:
+            self._fetch_step += 1
+
+        fingerprint = self._fingerprint(records)
+        if fingerprint is None or fingerprint != self._data_fingerprint:
+            self._data_fingerprint = fingerprint
+            self._records = records
+            self._model.set_records(records)
+        self.record_count_label.setText(f"{self._total_records} records")
+        if self._loading:
+            self.set_loading(False)
+        else:
+            self._update_pagination()
 
-        self._update_table()
-        self._update_pagination()
-
-    def _update_table(self) -> None:
-        """Update table contents with current records."""
-        if not self._schema:
-            return
-
-        columns = self._schema.all_columns_sorted
-        self.table.setRowCount(len(self._records))
+        if paging_state is not None:
+            self.prefetch_requested.emit(paging_state)
 
-        for row_idx, record in enumerate(self._records):
-            for col_idx, col in enumerate(columns):
-                value = record.get(col.name)
-                display_value = format_value_for_display(value, col.cql_type)
+    def _fingerprint(self, records: list[dict]) -> Optional[tuple]:
+        """
+        Cheap page identity: row count plus first/last primary keys.
 
-                item = QTableWidgetItem(display_value)
-                item.setData(Qt.UserRole, value)  # Store original value
+        Returns None when no schema is set, in which case set_data
+        always repopulates.
+        """
+        if not self._schema:
+            return None
+        pk_names = self._schema.primary_key_names
+        if not records:
+            return (0, (), ())
+        return (
+            len(records),
+            tuple(records[0].get(pk) for pk in pk_names),
+            tuple(records[-1].get(pk) for pk in pk_names),
+        )
+
+    def set_prefetch(self, future) -> None:
+        """Stash the in-flight future for the next page's rows."""
+        self._prefetch_future = future
+
+    @Slot(list)
+    @Slot(list, object)
+    def append_data(self, records: list[dict],
+                    paging_state: Optional[bytes] = None) -> None:
+        """
+        Append the next page's rows below the current ones.
 
-                # Visual indication for primary key columns
-                if col.is_primary_key:
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+        For load-more style paging: the view keeps its scroll position
+        and selection. Use set_data when the filter or table changes.
 
-                self.table.setItem(row_idx, col_idx, item)
+        Args:
+            records: Records to append.
+            paging_state: Driver state for the page after these rows,
+                or None when they are the last.
+        """
+        self._model.append_rows(records)
+        self._total_records = len(self._records)
+        self._data_fingerprint = self._fingerprint(self._records)
+        self._next_paging_state = paging_state
+        if self.effective_fetch_size() < self._page_size:
+            self._fetch_step += 1
 
         self.record_count_label.setText(f"{self._total_records} records")
+        if self._loading:
+            self.set_loading(False)
+        else:
+            self._update_pagination()
 
     def _update_pagination(self) -> None:
         """Update pagination controls."""
-        total_pages = max(1, (self._total_records + self._page_size - 1) // self._page_size)
-        self.page_label.setText(f"Page {self._page + 1} of {total_pages}")
+        self.page_label.setText(f"Page {len(self._paging_stack)}")
+
+        self.prev_button.setEnabled(len(self._paging_stack) > 1)
+        self.next_button.setEnabled(self._next_paging_state is not None)
 
-        self.prev_button.setEnabled(self._page > 0)
-        self.next_button.setEnabled((self._page + 1) * self._page_size < self._total_records)
+    def _current_row(self) -> int:
+        """Get the view row of the current selection, or -1."""
+        index = self.table.selectionModel().currentIndex()
+        return index.row() if index.isValid() else -1
 
-    def _on_selection_changed(self) -> None:
+    def _on_selection_changed(self, selected, deselected) -> None:
         """Handle row selection change."""
-        selected = self.table.selectedItems()
-        has_selection = len(selected) > 0
+        has_selection = self.table.selectionModel().hasSelection()
 
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
 
         if has_selection:
-            row = self.table.currentRow()
-            if 0 <= row < len(self._records):
-                self.record_selected.emit(self._records[row])
+            record = self._model.record_at(self._current_row())
+            if record is not None:
+                self.record_selected.emit(record)
 
-    def _on_double_click(self, row: int, column: int) -> None:
+    def _on_double_click(self, index: QModelIndex) -> None:
         """Handle double-click on a row."""
-        if 0 <= row < len(self._records):
-            self.edit_requested.emit(self._records[row])
+        record = self._model.record_at(index.row())
+        if record is not None:
+            self.edit_requested.emit(record)
 
     def _on_edit(self) -> None:
         """Handle edit button click."""
-        row = self.table.currentRow()
-        if 0 <= row < len(self._records):
-            self.edit_requested.emit(self._records[row])
+        record = self._model.record_at(self._current_row())
+        if record is not None:
+            self.edit_requested.emit(record)
 
     def _on_delete(self) -> None:
         """Handle delete button click with confirmation."""
-        row = self.table.currentRow()
-        if 0 <= row < len(self._records):
-            record = self._records[row]
-
+        record = self._model.record_at(self._current_row())
+        if record is not None:
             # Build confirmation message
             pk_info = []
             if self._schema:
@@ -262,42 +537,98 @@ class DataGrid(QWidget):
             if result == QMessageBox.Yes:
                 self.delete_requested.emit(record)
 
+    def set_filter_debounce_ms(self, interval: int) -> None:
+        """
+        Set the filter typing debounce interval in milliseconds.
+
+        Small tables can afford a snappier 100 ms; the default 300 ms
+        suits typical clusters.
+        """
+        self._filter_debounce.setInterval(interval)
+
     def _apply_filter(self) -> None:
         """Apply the current filter."""
+        # Cancel any pending debounce so an explicit Enter/click does
+        # not fire the same query a second time moments later.
+        self._filter_debounce.stop()
+
         column = self.filter_column.currentText()
         value = self.filter_input.text().strip()
 
         if column and value:
-            self._page = 0
-            self.filter_changed.emit({column: value})
+            self._reset_paging()
+            self.filter_changed.emit(column, (value,))
 
     def _clear_filter(self) -> None:
         """Clear the current filter."""
         self.filter_input.clear()
-        self._page = 0
-        self.filter_changed.emit({})
+        self._reset_paging()
+        self.filter_changed.emit("", ())
+
+    def _reset_paging(self) -> None:
+        """Drop pagination state, returning to the first page."""
+        self._paging_stack = [None]
+        self._next_paging_state = None
+        self._fetch_step = 0
+        self._prefetch_future = None
+        self._data_fingerprint = None
+
+    def effective_fetch_size(self) -> int:
+        """
+        Fetch size the caller should use for the next query.
+
+        Ramps from a small initial fetch up to the configured page size,
+        doubling per completed fetch, so time-to-first-row scales with
+        the initial fetch rather than the full page.
+        """
+        return min(self._page_size,
+                   self._initial_fetch_size * 2 ** self._fetch_step)
 
     def _prev_page(self) -> None:
         """Go to previous page."""
-        if self._page > 0:
-            self._page -= 1
+        if len(self._paging_stack) > 1:
+            self._paging_stack.pop()
+            # Any prefetch was for the forward direction; drop it.
+            self._prefetch_future = None
             self.refresh_requested.emit()
 
     def _next_page(self) -> None:
         """Go to next page."""
-        if (self._page + 1) * self._page_size < self._total_records:
-            self._page += 1
+        if self._next_paging_state is None:
+            return
+
+        self._paging_stack.append(self._next_paging_state)
+
+        future = self._prefetch_future
+        self._prefetch_future = None
+        if future is not None:
+            # Common forward-scan case: the rows are usually already
+            # here, so Next costs a result() on a finished future.
+            try:
+                rows = future.result()
+            except Exception:
+                self.refresh_requested.emit()
+                return
+            self.set_data(list(rows.current_rows),
+                          paging_state=rows.paging_state)
+        else:
             self.refresh_requested.emit()
 
     def _on_page_size_changed(self, value: int) -> None:
         """Handle page size change."""
         self._page_size = value
-        self._page = 0
+        # Old paging states encode the previous page boundaries.
+        self._reset_paging()
         self.refresh_requested.emit()
 
     @property
     def current_page(self) -> int:
-        return self._page
+        return len(self._paging_stack) - 1
+
+    @property
+    def paging_state(self) -> Optional[bytes]:
+        """Paging state to pass to the driver for the requested page."""
+        return self._paging_stack[-1]
 
     @property
     def page_size(self) -> int:
@@ -305,7 +636,4 @@ class DataGrid(QWidget):
 
     def get_selected_record(self) -> Optional[dict]:
         """Get the currently selected record."""
-        row = self.table.currentRow()
-        if 0 <= row < len(self._records):
-            return self._records[row]
-        return None
\ No newline at end of file
+        return self._model.record_at(self._current_row())
\ No newline at end of file
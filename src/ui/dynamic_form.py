@@ -12,11 +12,19 @@ from PySide6.QtWidgets import (
     QDateEdit, QTimeEdit, QDateTimeEdit, QPushButton, QLabel,
     QGroupBox, QMessageBox, QFrame
 )
-from PySide6.QtCore import Qt, QDate, QTime, QDateTime, Signal
+from PySide6.QtCore import Qt, QDate, QTime, QDateTime, QEvent, QPoint, Signal
 from datetime import datetime, date, time
 
 from src.database.schema import TableSchema, ColumnInfo
-from src.utils.type_mapping import get_type_info, convert_value, format_value_for_display
+from src.utils.type_mapping import get_type_info, format_value_for_display_base
+
+
+def _convert_or_raw(convert: Any, raw: Any) -> Any:
+    """Apply a converter, falling back to the raw value on failure."""
+    try:
+        return convert(raw)
+    except Exception:
+        return raw
 
 
 class DynamicFormField(QWidget):
@@ -49,14 +57,11 @@ class DynamicFormField(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        widget_type = self._type_info.get('widget', 'lineedit')
+        widget_type = self._type_info.widget
 
         if widget_type == 'spinbox':
             self._widget = QSpinBox()
-            self._widget.setRange(
-                self._type_info.get('min', -2147483648),
-                self._type_info.get('max', 2147483647)
-            )
+            self._widget.setRange(self._type_info.min, self._type_info.max)
             self._widget.valueChanged.connect(self.value_changed.emit)
 
         elif widget_type == 'doublespinbox':
@@ -72,7 +77,7 @@ class DynamicFormField(QWidget):
         elif widget_type == 'textedit':
             self._widget = QTextEdit()
             self._widget.setMaximumHeight(100)
-            placeholder = self._type_info.get('placeholder', '')
+            placeholder = self._type_info.placeholder
             if placeholder:
                 self._widget.setPlaceholderText(placeholder)
             self._widget.textChanged.connect(self.value_changed.emit)
@@ -96,7 +101,7 @@ class DynamicFormField(QWidget):
 
         else:  # Default: lineedit
             self._widget = QLineEdit()
-            placeholder = self._type_info.get('placeholder', '')
+            placeholder = self._type_info.placeholder
             if placeholder:
                 self._widget.setPlaceholderText(placeholder)
             self._widget.textChanged.connect(self.value_changed.emit)
@@ -106,11 +111,106 @@ class DynamicFormField(QWidget):
             self._widget.setProperty("required", True)
 
         # Set readonly if needed
-        if self._type_info.get('readonly'):
+        if self._type_info.readonly:
             self._widget.setEnabled(False)
 
         layout.addWidget(self._widget)
 
+        # Resolve the value accessors once instead of re-walking
+        # widget-type if-chains on every get_value/set_value/clear call
+        # (once per field per form load or submit).
+        self._widget_type = widget_type
+        self._getter = {
+            'spinbox': self._widget.value,
+            'doublespinbox': self._widget.value,
+            'checkbox': self._widget.isChecked,
+            'textedit': self._widget.toPlainText,
+            'datetime': self._get_datetime,
+            'date': self._get_date,
+            'time': self._get_time,
+        }.get(widget_type, self._widget.text)
+        self._setter = {
+            'spinbox': self._set_spin,
+            'doublespinbox': self._set_double,
+            'checkbox': self._set_checkbox,
+            'textedit': self._set_textedit,
+            'datetime': self._set_datetime,
+            'date': self._set_date,
+            'time': self._set_time,
+        }.get(widget_type, self._set_lineedit)
+        self._clearer = {
+            'spinbox': self._clear_spin,
+            'doublespinbox': self._clear_double,
+            'checkbox': self._clear_checkbox,
+            'datetime': self._clear_datetime,
+            'date': self._clear_date,
+            'time': self._clear_time,
+        }.get(widget_type, self._widget.clear)
+
+    def _get_datetime(self) -> datetime:
+        return self._widget.dateTime().toPython()
+
+    def _get_date(self) -> date:
+        return self._widget.date().toPython()
+
+    def _get_time(self) -> time:
+        return self._widget.time().toPython()
+
+    def _set_spin(self, value: Any) -> None:
+        self._widget.setValue(int(value))
+
+    def _set_double(self, value: Any) -> None:
+        self._widget.setValue(float(value))
+
+    def _set_checkbox(self, value: Any) -> None:
+        self._widget.setChecked(bool(value))
+
+    def _set_textedit(self, value: Any) -> None:
+        self._widget.setPlainText(
+            format_value_for_display_base(value, self._type_info.base_type))
+
+    def _set_datetime(self, value: Any) -> None:
+        if isinstance(value, datetime):
+            self._widget.setDateTime(QDateTime(value))
+        else:
+            self._widget.setDateTime(
+                QDateTime.fromString(str(value), Qt.ISODate))
+
+    def _set_date(self, value: Any) -> None:
+        if isinstance(value, date):
+            self._widget.setDate(QDate(value.year, value.month, value.day))
+        else:
+            self._widget.setDate(QDate.fromString(str(value), Qt.ISODate))
+
+    def _set_time(self, value: Any) -> None:
+        if isinstance(value, time):
+            self._widget.setTime(
+                QTime(value.hour, value.minute, value.second))
+        else:
+            self._widget.setTime(QTime.fromString(str(value)))
+
+    def _set_lineedit(self, value: Any) -> None:
+        self._widget.setText(
+            format_value_for_display_base(value, self._type_info.base_type))
+
+    def _clear_spin(self) -> None:
+        self._widget.setValue(0)
+
+    def _clear_double(self) -> None:
+        self._widget.setValue(0.0)
+
+    def _clear_checkbox(self) -> None:
+        self._widget.setChecked(False)
+
+    def _clear_datetime(self) -> None:
+        self._widget.setDateTime(QDateTime.currentDateTime())
+
+    def _clear_date(self) -> None:
+        self._widget.setDate(QDate.currentDate())
+
+    def _clear_time(self) -> None:
+        self._widget.setTime(QTime.currentTime())
+
     @property
     def column(self) -> ColumnInfo:
         """Get the column info."""
@@ -123,24 +223,7 @@ class DynamicFormField(QWidget):
         Returns:
             Value converted to appropriate Python type.
         """
-        widget_type = self._type_info.get('widget', 'lineedit')
-
-        if widget_type == 'spinbox':
-            return self._widget.value()
-        elif widget_type == 'doublespinbox':
-            return self._widget.value()
-        elif widget_type == 'checkbox':
-            return self._widget.isChecked()
-        elif widget_type == 'textedit':
-            return self._widget.toPlainText()
-        elif widget_type == 'datetime':
-            return self._widget.dateTime().toPython()
-        elif widget_type == 'date':
-            return self._widget.date().toPython()
-        elif widget_type == 'time':
-            return self._widget.time().toPython()
-        else:
-            return self._widget.text()
+        return self._getter()
 
     def set_value(self, value: Any) -> None:
         """
@@ -153,59 +236,14 @@ class DynamicFormField(QWidget):
             self.clear()
             return
 
-        widget_type = self._type_info.get('widget', 'lineedit')
-
         try:
-            if widget_type == 'spinbox':
-                self._widget.setValue(int(value))
-            elif widget_type == 'doublespinbox':
-                self._widget.setValue(float(value))
-            elif widget_type == 'checkbox':
-                self._widget.setChecked(bool(value))
-            elif widget_type == 'textedit':
-                formatted = format_value_for_display(value, self._column.cql_type)
-                self._widget.setPlainText(formatted)
-            elif widget_type == 'datetime':
-                if isinstance(value, datetime):
-                    self._widget.setDateTime(QDateTime(value))
-                else:
-                    self._widget.setDateTime(QDateTime.fromString(str(value), Qt.ISODate))
-            elif widget_type == 'date':
-                if isinstance(value, date):
-                    self._widget.setDate(QDate(value.year, value.month, value.day))
-                else:
-                    self._widget.setDate(QDate.fromString(str(value), Qt.ISODate))
-            elif widget_type == 'time':
-                if isinstance(value, time):
-                    self._widget.setTime(QTime(value.hour, value.minute, value.second))
-                else:
-                    self._widget.setTime(QTime.fromString(str(value)))
-            else:
-                formatted = format_value_for_display(value, self._column.cql_type)
-                self._widget.setText(formatted)
+            self._setter(value)
         except Exception as e:
             print(f"Warning: Could not set value for {self._column.name}: {e}")
 
     def clear(self) -> None:
         """Clear the widget value."""
-        widget_type = self._type_info.get('widget', 'lineedit')
-
-        if widget_type == 'spinbox':
-            self._widget.setValue(0)
-        elif widget_type == 'doublespinbox':
-            self._widget.setValue(0.0)
-        elif widget_type == 'checkbox':
-            self._widget.setChecked(False)
-        elif widget_type == 'textedit':
-            self._widget.clear()
-        elif widget_type == 'datetime':
-            self._widget.setDateTime(QDateTime.currentDateTime())
-        elif widget_type == 'date':
-            self._widget.setDate(QDate.currentDate())
-        elif widget_type == 'time':
-            self._widget.setTime(QTime.currentTime())
-        else:
-            self._widget.clear()
+        self._clearer()
 
     def set_readonly(self, readonly: bool) -> None:
         """Set field as readonly."""
@@ -237,6 +275,19 @@ class DynamicRecordForm(QWidget):
         super().__init__(parent)
         self._schema = schema
         self._fields: dict[str, DynamicFormField] = {}
+        # Regular columns start as cheap placeholders and are turned
+        # into real fields only when scrolled into view, so opening the
+        # form for a wide table pays for the visible rows, not all of
+        # them. Values loaded before materialization wait here.
+        self._pending: dict[str, tuple[ColumnInfo, QWidget]] = {}
+        self._pending_values: dict[str, Any] = {}
+        # Per-column converters resolved once from the schema: submit
+        # does one dict lookup and call per column instead of passing
+        # type names back into convert_value's dispatch.
+        self._converters = schema.parsers
+        # (name, getter, converter) triples for get_data; rebuilt when
+        # a placeholder materializes into a real field.
+        self._submit_plan: Optional[list[tuple]] = None
         self._mode = "insert"  # "insert" or "update"
         self._original_record = None
 
@@ -280,18 +331,22 @@ class DynamicRecordForm(QWidget):
 
         scroll_layout.addWidget(pk_group)
 
-        # Regular columns group
+        # Regular columns group: placeholders only, materialized when
+        # they scroll into view.
+        self._reg_layout: Optional[QFormLayout] = None
         if self._schema.regular_columns:
             reg_group = QGroupBox("Columns")
             reg_layout = QFormLayout(reg_group)
             reg_layout.setSpacing(8)
+            self._reg_layout = reg_layout
 
             for col in self._schema.regular_columns:
-                field = DynamicFormField(col)
-                self._fields[col.name] = field
+                placeholder = QWidget()
+                placeholder.setFixedHeight(32)
+                self._pending[col.name] = (col, placeholder)
 
                 label = QLabel(f"{col.name} ({col.cql_type}):")
-                reg_layout.addRow(label, field)
+                reg_layout.addRow(label, placeholder)
 
             scroll_layout.addWidget(reg_group)
 
@@ -299,6 +354,9 @@ class DynamicRecordForm(QWidget):
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
 
+        self._scroll = scroll
+        scroll.viewport().installEventFilter(self)
+
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -314,6 +372,44 @@ class DynamicRecordForm(QWidget):
 
         layout.addLayout(button_layout)
 
+    def eventFilter(self, obj, event) -> bool:
+        """Materialize placeholder fields as the viewport reveals them."""
+        if event.type() in (QEvent.Paint, QEvent.Resize):
+            self._materialize_visible()
+        return super().eventFilter(obj, event)
+
+    def _materialize_visible(self) -> None:
+        """Replace placeholders currently inside the viewport."""
+        if not self._pending:
+            return
+
+        viewport = self._scroll.viewport()
+        height = viewport.height()
+        for name in list(self._pending):
+            placeholder = self._pending[name][1]
+            top = placeholder.mapTo(viewport, QPoint(0, 0)).y()
+            if -placeholder.height() <= top <= height:
+                self._materialize(name)
+
+    def _materialize(self, name: str) -> DynamicFormField:
+        """Swap a placeholder for a real field, applying any loaded value."""
+        col, placeholder = self._pending.pop(name)
+        field = DynamicFormField(col)
+        self._fields[name] = field
+        self._submit_plan = None
+
+        self._reg_layout.replaceWidget(placeholder, field)
+        placeholder.deleteLater()
+
+        if name in self._pending_values:
+            field.set_value(self._pending_values.pop(name))
+        return field
+
+    def _materialize_all(self) -> None:
+        """Force-create every remaining placeholder field."""
+        for name in list(self._pending):
+            self._materialize(name)
+
     def set_mode(self, mode: str) -> None:
         """
         Set form mode (insert or update).
@@ -349,9 +445,15 @@ class DynamicRecordForm(QWidget):
             else:
                 field.clear()
 
+        # Not-yet-materialized fields pick their value up on creation.
+        self._pending_values = {
+            name: record[name] for name in self._pending if name in record
+        }
+
     def clear(self) -> None:
         """Clear all form fields."""
         self._original_record = None
+        self._pending_values.clear()
         for field in self._fields.values():
             field.clear()
 
@@ -383,13 +485,13 @@ class DynamicRecordForm(QWidget):
             return
 
         # Collect and convert values
+        self._materialize_all()
         record = {}
         for col_name, field in self._fields.items():
             raw_value = field.get_value()
             if raw_value is not None and raw_value != '':
                 try:
-                    converted = convert_value(raw_value, field.column.cql_type)
-                    record[col_name] = converted
+                    record[col_name] = self._converters[col_name](raw_value)
                 except Exception as e:
                     QMessageBox.warning(
                         self,
@@ -407,13 +509,64 @@ class DynamicRecordForm(QWidget):
         Returns:
             Dictionary of column names to values.
         """
-        record = {}
-        for col_name, field in self._fields.items():
-            raw_value = field.get_value()
-            if raw_value is not None and raw_value != '':
-                try:
-                    converted = convert_value(raw_value, field.column.cql_type)
-                    record[col_name] = converted
-                except:
-                    record[col_name] = raw_value
-        return record
\ No newline at end of file
+        self._materialize_all()
+        if self._submit_plan is None:
+            self._submit_plan = [
+                (name, field.get_value, self._converters[name])
+                for name, field in self._fields.items()
+            ]
+
+        return {
+            name: _convert_or_raw(convert, raw)
+            for name, getter, convert in self._submit_plan
+            if (raw := getter()) is not None and raw != ''
+        }
+
+class RecordFormCache:
+    """
+    Reuses one DynamicRecordForm per (keyspace, table).
+
+    Building a form reconstructs a field — widget, layout, and signal
+    wiring — per column, which is hundreds of Qt allocations for a wide
+    schema. Hosts that open insert/edit forms repeatedly should hold one
+    of these and fetch through get(): the first open per table builds
+    the form, later opens reset and remode the cached one.
+    """
+
+    def __init__(self):
+        self._forms: dict[tuple[str, str], DynamicRecordForm] = {}
+
+    def get(self, schema: TableSchema, mode: str = "insert") -> DynamicRecordForm:
+        """
+        Get a cleared form for a table, building it on first use.
+
+        Args:
+            schema: Table schema the form edits.
+            mode: "insert" or "update", applied before returning.
+
+        Returns:
+            A DynamicRecordForm ready for load_record or direct entry.
+        """
+        key = (schema.keyspace, schema.table_name)
+        form = self._forms.get(key)
+        if form is None:
+            form = DynamicRecordForm(schema)
+            self._forms[key] = form
+        else:
+            form.clear()
+        form.set_mode(mode)
+        return form
+
+    def invalidate(self, keyspace: str = None, table: str = None) -> None:
+        """
+        Drop cached forms whose schema may have changed.
+
+        With no arguments everything is dropped; with a keyspace (and
+        optionally a table) only the matching entries go.
+        """
+        for key in list(self._forms):
+            if keyspace is not None and key[0] != keyspace:
+                continue
+            if table is not None and key[1] != table:
+                continue
+            self._forms.pop(key).deleteLater()
@@ -5,16 +5,48 @@ Displays hierarchical view of connections, keyspaces, and tables.
 Handles user interaction for navigation and selection.
 """
 
-from typing import Optional, Callable
+from functools import partial
+from typing import NamedTuple, Optional, Callable
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget,
     QTreeWidgetItem, QPushButton, QLabel, QMenu
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QAction
 
 from src.config.settings import ConnectionProfile
 
+# Keyspaces with more tables than this get a placeholder child and are
+# materialized in chunks on expansion, so set_tables stays O(1) for
+# pathological keyspaces instead of freezing the UI building thousands
+# of items.
+_LAZY_TABLE_THRESHOLD = 500
+_LAZY_TABLE_CHUNK = 200
+
+# Item payload kinds, compared by int instead of string.
+KIND_CONN, KIND_KS, KIND_TABLE = 0, 1, 2
+
+
+# Item payloads stored under Qt.UserRole. NamedTuples are cheaper to
+# build and read than per-item dicts (no hashing, attribute access) and
+# a tree with thousands of tables allocates one per item.
+class _ConnPayload(NamedTuple):
+    kind: int
+    name: str
+
+
+class _KsPayload(NamedTuple):
+    kind: int
+    connection: str
+    name: str
+
+
+class _TablePayload(NamedTuple):
+    kind: int
+    connection: str
+    keyspace: str
+    name: str
+
 
 class NavigationSidebar(QWidget):
     """
@@ -34,6 +66,20 @@ class NavigationSidebar(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # O(1) item lookup indices, maintained by set_connections and
+        # set_keyspaces; the alternative is rescanning the tree per
+        # update, which goes quadratic as connections/keyspaces grow.
+        self._conn_items: dict[str, QTreeWidgetItem] = {}
+        self._ks_items: dict[tuple[str, str], QTreeWidgetItem] = {}
+        # Table lists awaiting first expansion, and a version counter
+        # per keyspace so queued chunk timers from a superseded
+        # set_tables call stop appending.
+        self._deferred_tables: dict[tuple[str, str], list[str]] = {}
+        self._tables_version: dict[tuple[str, str], int] = {}
+        # Last applied connection list and active name, so
+        # set_connections can diff instead of rebuilding the tree.
+        self._last_conn_names: list[str] = []
+        self._active_name: Optional[str] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -60,12 +106,28 @@ class NavigationSidebar(QWidget):
         # Tree widget
         self.tree = QTreeWidget()
         self.tree.setHeaderHidden(True)
+        # All rows are plain single-line text, so Qt can skip the
+        # per-item size-hint query during layout and scrolling.
+        self.tree.setUniformRowHeights(True)
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
         self.tree.itemClicked.connect(self._on_item_clicked)
         self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.itemExpanded.connect(self._materialize_children)
         layout.addWidget(self.tree)
 
+        # Reusable context menu for connection items: built once and
+        # retargeted per show, instead of allocating a QMenu, two
+        # QActions, and two closures on every right-click.
+        self._menu_conn_name: Optional[str] = None
+        self._conn_menu = QMenu(self)
+        self._edit_action = QAction("Edit Connection", self)
+        self._edit_action.triggered.connect(self._emit_edit_requested)
+        self._conn_menu.addAction(self._edit_action)
+        self._delete_action = QAction("Delete Connection", self)
+        self._delete_action.triggered.connect(self._emit_delete_requested)
+        self._conn_menu.addAction(self._delete_action)
+
     def set_connections(self, connections: list[ConnectionProfile], active_name: str = None):
         """
         Update the list of connections in the tree.
@@ -74,29 +136,67 @@ class NavigationSidebar(QWidget):
             connections: List of connection profiles.
             active_name: Name of the currently active connection.
         """
-        # Store current expansion state
-        expanded_items = set()
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if item.isExpanded():
-                expanded_items.add(item.text(0))
-
-        self.tree.clear()
-
-        for conn in connections:
-            item = QTreeWidgetItem([conn.name])
-            item.setData(0, Qt.UserRole, {"type": "connection", "name": conn.name})
-
-            if conn.name == active_name:
-                font = item.font(0)
-                font.setBold(True)
-                item.setFont(0, font)
+        new_names = [conn.name for conn in connections]
 
-            self.tree.addTopLevelItem(item)
+        # Most calls change nothing (reruns after navigation); skip the
+        # tree work entirely in that case.
+        if new_names == self._last_conn_names and active_name == self._active_name:
+            return
 
-            # Restore expansion
-            if conn.name in expanded_items:
-                item.setExpanded(True)
+        # Diff against the current items instead of clear()+rebuild:
+        # untouched connections keep their keyspace/table children,
+        # expansion, and selection, and the view relayouts only around
+        # the rows that actually changed.
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            # Drop connections that disappeared (backwards so indices
+            # stay valid while removing).
+            new_set = set(new_names)
+            for i in range(self.tree.topLevelItemCount() - 1, -1, -1):
+                name = self.tree.topLevelItem(i).text(0)
+                if name in new_set:
+                    continue
+                self.tree.takeTopLevelItem(i)
+                self._conn_items.pop(name, None)
+                for index in (self._ks_items, self._deferred_tables,
+                              self._tables_version):
+                    for key in [k for k in index if k[0] == name]:
+                        del index[key]
+                if name == self._active_name:
+                    self._active_name = None
+
+            # Insert new connections and move survivors into position.
+            for pos, name in enumerate(new_names):
+                item = self._conn_items.get(name)
+                if item is None:
+                    item = QTreeWidgetItem([name])
+                    item.setData(0, Qt.UserRole,
+                                 _ConnPayload(KIND_CONN, name))
+                    self._conn_items[name] = item
+                    self.tree.insertTopLevelItem(pos, item)
+                else:
+                    current = self.tree.indexOfTopLevelItem(item)
+                    if current != pos:
+                        was_expanded = item.isExpanded()
+                        self.tree.takeTopLevelItem(current)
+                        self.tree.insertTopLevelItem(pos, item)
+                        item.setExpanded(was_expanded)
+
+            # Re-bold only the items whose active state changed.
+            if active_name != self._active_name:
+                for name in (self._active_name, active_name):
+                    item = self._conn_items.get(name) if name else None
+                    if item is not None:
+                        font = item.font(0)
+                        font.setBold(name == active_name)
+                        item.setFont(0, font)
+                self._active_name = active_name
+
+            self._last_conn_names = new_names
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
 
     def set_keyspaces(self, connection_name: str, keyspaces: list[str]):
         """
@@ -106,26 +206,33 @@ class NavigationSidebar(QWidget):
             connection_name: Name of the connection.
             keyspaces: List of keyspace names.
         """
-        # Find connection item
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            data = item.data(0, Qt.UserRole)
-            if data and data.get("name") == connection_name:
-                # Clear existing keyspaces
-                item.takeChildren()
-
-                # Add keyspaces
-                for ks in keyspaces:
-                    ks_item = QTreeWidgetItem([ks])
-                    ks_item.setData(0, Qt.UserRole, {
-                        "type": "keyspace",
-                        "connection": connection_name,
-                        "name": ks
-                    })
-                    item.addChild(ks_item)
-
-                item.setExpanded(True)
-                break
+        item = self._conn_items.get(connection_name)
+        if item is None:
+            return
+
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            # Clear existing keyspaces
+            item.takeChildren()
+            for key in list(self._ks_items):
+                if key[0] == connection_name:
+                    del self._ks_items[key]
+
+            # Add keyspaces in one batch
+            ks_items = []
+            for ks in keyspaces:
+                ks_item = QTreeWidgetItem([ks])
+                ks_item.setData(0, Qt.UserRole,
+                                _KsPayload(KIND_KS, connection_name, ks))
+                ks_items.append(ks_item)
+                self._ks_items[(connection_name, ks)] = ks_item
+
+            item.addChildren(ks_items)
+            item.setExpanded(True)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
 
     def set_tables(self, connection_name: str, keyspace: str, tables: list[str]):
         """
@@ -136,33 +243,90 @@ class NavigationSidebar(QWidget):
             keyspace: Keyspace name.
             tables: List of table names.
         """
-        # Find keyspace item
-        for i in range(self.tree.topLevelItemCount()):
-            conn_item = self.tree.topLevelItem(i)
-            conn_data = conn_item.data(0, Qt.UserRole)
-
-            if conn_data and conn_data.get("name") == connection_name:
-                for j in range(conn_item.childCount()):
-                    ks_item = conn_item.child(j)
-                    ks_data = ks_item.data(0, Qt.UserRole)
-
-                    if ks_data and ks_data.get("name") == keyspace:
-                        # Clear existing tables
-                        ks_item.takeChildren()
-
-                        # Add tables
-                        for table in tables:
-                            table_item = QTreeWidgetItem([table])
-                            table_item.setData(0, Qt.UserRole, {
-                                "type": "table",
-                                "connection": connection_name,
-                                "keyspace": keyspace,
-                                "name": table
-                            })
-                            ks_item.addChild(table_item)
-
-                        ks_item.setExpanded(True)
-                        return
+        key = (connection_name, keyspace)
+        ks_item = self._ks_items.get(key)
+        if ks_item is None:
+            # Defensive fallback: if the index has lost track of the item
+            # (e.g. it was created outside set_keyspaces), a recursive
+            # text search can still find it — and heals the index so the
+            # next call is back on the O(1) path.
+            for candidate in self.tree.findItems(
+                    keyspace, Qt.MatchExactly | Qt.MatchRecursive, 0):
+                data = candidate.data(0, Qt.UserRole)
+                if (data and data.kind == KIND_KS
+                        and data.connection == connection_name):
+                    ks_item = candidate
+                    self._ks_items[key] = candidate
+                    break
+            if ks_item is None:
+                return
+
+        self._tables_version[key] = self._tables_version.get(key, 0) + 1
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            # Clear existing tables
+            ks_item.takeChildren()
+            self._deferred_tables.pop(key, None)
+
+            # Very large keyspaces get a placeholder and materialize in
+            # chunks when (and if) the user expands them.
+            if len(tables) > _LAZY_TABLE_THRESHOLD:
+                self._deferred_tables[key] = list(tables)
+                ks_item.addChild(QTreeWidgetItem(
+                    [f"Loading… ({len(tables)} tables)"]))
+                return
+
+            # Add tables in one batch
+            ks_item.addChildren(self._build_table_items(key, tables))
+            ks_item.setExpanded(True)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+
+    def _build_table_items(self, key: tuple[str, str],
+                           tables: list[str]) -> list[QTreeWidgetItem]:
+        """Build tree items for table names under a keyspace."""
+        connection_name, keyspace = key
+        items = []
+        for table in tables:
+            table_item = QTreeWidgetItem([table])
+            table_item.setData(0, Qt.UserRole, _TablePayload(
+                KIND_TABLE, connection_name, keyspace, table))
+            items.append(table_item)
+        return items
+
+    def _materialize_children(self, item: QTreeWidgetItem) -> None:
+        """Start chunked population of a lazily-deferred keyspace."""
+        data = item.data(0, Qt.UserRole)
+        if not data or data.kind != KIND_KS:
+            return
+
+        key = (data.connection, data.name)
+        tables = self._deferred_tables.pop(key, None)
+        if tables is None:
+            return
+
+        item.takeChildren()  # drop the placeholder
+        self._add_table_chunk(item, key, tables, 0,
+                              self._tables_version.get(key, 0))
+
+    def _add_table_chunk(self, ks_item: QTreeWidgetItem,
+                         key: tuple[str, str], tables: list[str],
+                         start: int, version: int) -> None:
+        """Append one chunk of deferred tables, rescheduling the rest."""
+        # A newer set_tables/set_keyspaces call owns the item now.
+        if (version != self._tables_version.get(key, 0)
+                or self._ks_items.get(key) is not ks_item):
+            return
+
+        end = min(start + _LAZY_TABLE_CHUNK, len(tables))
+        ks_item.addChildren(self._build_table_items(key, tables[start:end]))
+
+        if end < len(tables):
+            QTimer.singleShot(
+                0, partial(self._add_table_chunk, ks_item, key,
+                           tables, end, version))
 
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle single click on tree item."""
@@ -170,14 +334,12 @@ class NavigationSidebar(QWidget):
         if not data:
             return
 
-        item_type = data.get("type")
-
-        if item_type == "connection":
-            self.connection_selected.emit(data["name"])
-        elif item_type == "keyspace":
-            self.keyspace_selected.emit(data["name"])
-        elif item_type == "table":
-            self.table_selected.emit(data["keyspace"], data["name"])
+        if data.kind == KIND_CONN:
+            self.connection_selected.emit(data.name)
+        elif data.kind == KIND_KS:
+            self.keyspace_selected.emit(data.name)
+        elif data.kind == KIND_TABLE:
+            self.table_selected.emit(data.keyspace, data.name)
 
     def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle double click on tree item."""
@@ -185,10 +347,16 @@ class NavigationSidebar(QWidget):
         if not data:
             return
 
-        item_type = data.get("type")
+        if data.kind == KIND_TABLE:
+            self.table_selected.emit(data.keyspace, data.name)
 
-        if item_type == "table":
-            self.table_selected.emit(data["keyspace"], data["name"])
+    def _emit_edit_requested(self) -> None:
+        if self._menu_conn_name is not None:
+            self.connection_edit_requested.emit(self._menu_conn_name)
+
+    def _emit_delete_requested(self) -> None:
+        if self._menu_conn_name is not None:
+            self.connection_delete_requested.emit(self._menu_conn_name)
 
     def _show_context_menu(self, position):
         """Show context menu for tree items."""
@@ -197,24 +365,8 @@ class NavigationSidebar(QWidget):
             return
 
         data = item.data(0, Qt.UserRole)
-        if not data:
+        if not data or data.kind != KIND_CONN:
             return
 
-        menu = QMenu(self)
-        item_type = data.get("type")
-
-        if item_type == "connection":
-            edit_action = QAction("Edit Connection", self)
-            edit_action.triggered.connect(
-                lambda: self.connection_edit_requested.emit(data["name"])
-            )
-            menu.addAction(edit_action)
-
-            delete_action = QAction("Delete Connection", self)
-            delete_action.triggered.connect(
-                lambda: self.connection_delete_requested.emit(data["name"])
-            )
-            menu.addAction(delete_action)
-
-        if not menu.isEmpty():
-            menu.exec(self.tree.viewport().mapToGlobal(position))
\ No newline at end of file
+        self._menu_conn_name = data.name
+        self._conn_menu.exec(self.tree.viewport().mapToGlobal(position))
\ No newline at end of file
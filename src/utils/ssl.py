@@ -8,31 +8,25 @@ from ssl import (
     PROTOCOL_TLSv1_1
 )
 
+# Single source of truth for supported protocols: lookup is one dict
+# probe instead of a string-comparison ladder, and the supported-names
+# list can never drift from the dispatch.
+_SSL_PROTOCOLS = {
+    'PROTOCOL_TLSv1_2': PROTOCOL_TLSv1_2,
+    'PROTOCOL_SSLv23': PROTOCOL_SSLv23,
+    'PROTOCOL_TLS': PROTOCOL_TLS,
+    'PROTOCOL_TLS_CLIENT': PROTOCOL_TLS_CLIENT,
+    'PROTOCOL_TLS_SERVER': PROTOCOL_TLS_SERVER,
+    'PROTOCOL_TLSv1': PROTOCOL_TLSv1,
+    'PROTOCOL_TLSv1_1': PROTOCOL_TLSv1_1,
+}
+
 
 def ssl_protocol(name: str):
-    if name == 'PROTOCOL_TLSv1_2':
-        return PROTOCOL_TLSv1_2
-    if name == 'PROTOCOL_SSLv23':
-        return PROTOCOL_SSLv23
-    if name == 'PROTOCOL_TLS':
-        return PROTOCOL_TLS
-    if name == 'PROTOCOL_TLS_CLIENT':
-        return PROTOCOL_TLS_CLIENT
-    if name == 'PROTOCOL_TLS_SERVER':
-        return PROTOCOL_TLS_SERVER
-    if name == 'PROTOCOL_TLSv1':
-        return PROTOCOL_TLSv1
-    if name == 'PROTOCOL_TLSv1_1':
-        return PROTOCOL_TLSv1_1
+    try:
+        return _SSL_PROTOCOLS[name]
+    except KeyError:
+        raise ValueError(name + ' is not a supported SSL protocol')
 
-    raise ValueError(name + 'is not a supported SSL protocol')
 
-supported_ssl_protocols = [
-    "PROTOCOL_TLSv1_2",
-    "PROTOCOL_SSLv23",
-    "PROTOCOL_TLS",
-    "PROTOCOL_TLS_CLIENT",
-    "PROTOCOL_TLS_SERVER",
-    "PROTOCOL_TLSv1",
-    "PROTOCOL_TLSv1_1"
-]
\ No newline at end of file
+supported_ssl_protocols = list(_SSL_PROTOCOLS)
@@ -5,14 +5,25 @@ Maps Cassandra CQL types to Python types and provides validation
 and conversion utilities for form field generation.
 """
 
+import json
 import re
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, date, time
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Optional, Tuple
 
-# Mapping of CQL types to Python types and form field types
-CQL_TYPE_MAP = {
+# Matches generic CQL types like list<text> or map<text, int>;
+# compiled once since parse_cql_type sits on the per-cell render path
+# (\Z is a slightly cheaper end anchor than $).
+_GENERIC_RE = re.compile(r'(\w+)<(.+)>\Z')
+
+# Mapping of CQL types to Python types and form field types. Wrapped in
+# a read-only proxy: cached TypeInfo instances are built straight from
+# these entries, so the map must never be mutated after import.
+CQL_TYPE_MAP = MappingProxyType({
     # Numeric types
     'int': {'python_type': int, 'widget': 'spinbox', 'min': -2147483648, 'max': 2147483647},
     'bigint': {'python_type': int, 'widget': 'spinbox', 'min': -9223372036854775808, 'max': 9223372036854775807},
@@ -56,18 +67,24 @@ CQL_TYPE_MAP = {
     # Tuple and frozen types
     'tuple': {'python_type': tuple, 'widget': 'textedit', 'placeholder': 'JSON array'},
     'frozen': {'python_type': object, 'widget': 'textedit', 'placeholder': 'JSON'},
-}
+})
 
 
-def parse_cql_type(cql_type: str) -> Tuple[str, Optional[list[str]]]:
+@lru_cache(maxsize=512)
+def parse_cql_type(cql_type: str) -> Tuple[str, Optional[Tuple[str, ...]]]:
     """
     Parse a CQL type string into base type and generic parameters.
 
+    Memoized: tables use a small set of type strings and this runs per
+    cell on render and conversion paths, so repeat calls are a cache
+    hit. Parameters come back as an immutable tuple so the cached value
+    is safe to share.
+
     Examples:
         'text' -> ('text', None)
-        'list<text>' -> ('list', ['text'])
-        'map<text, int>' -> ('map', ['text', 'int'])
-        'frozen<map<text, text>>' -> ('frozen', ['map<text, text>'])
+        'list<text>' -> ('list', ('text',))
+        'map<text, int>' -> ('map', ('text', 'int'))
+        'frozen<map<text, text>>' -> ('frozen', ('map<text, text>',))
 
     Args:
         cql_type: CQL type string.
@@ -76,49 +93,179 @@ def parse_cql_type(cql_type: str) -> Tuple[str, Optional[list[str]]]:
         Tuple of (base_type, type_parameters).
     """
     # Check for generic types
-    match = re.match(r'(\w+)<(.+)>$', cql_type)
+    match = _GENERIC_RE.match(cql_type)
     if match:
         base_type = match.group(1)
         params_str = match.group(2)
 
         # Simple parameter parsing (doesn't handle deeply nested types)
         if ',' in params_str and '<' not in params_str:
-            params = [p.strip() for p in params_str.split(',')]
+            params = tuple(p.strip() for p in params_str.split(','))
         else:
-            params = [params_str]
+            params = (params_str,)
 
         return base_type, params
 
     return cql_type, None
 
 
-def get_type_info(cql_type: str) -> dict:
+@dataclass(frozen=True, slots=True)
+class TypeInfo:
+    """Form-generation metadata for one CQL type."""
+    cql_type: str
+    base_type: str
+    type_params: Optional[Tuple[str, ...]]
+    python_type: type = str
+    widget: str = 'lineedit'
+    min: int = -2147483648
+    max: int = 2147483647
+    placeholder: str = ''
+    readonly: bool = False
+
+
+@lru_cache(maxsize=512)
+def get_type_info(cql_type: str) -> TypeInfo:
     """
     Get type information for a CQL type.
 
+    The returned TypeInfo is immutable and interned per type string, so
+    all form fields over the same CQL type share one instance and read
+    plain attributes instead of probing a dict with defaults.
+
     Args:
         cql_type: CQL type string.
 
     Returns:
-        Dictionary with type information for form generation.
+        TypeInfo describing widget and conversion behavior.
     """
     base_type, params = parse_cql_type(cql_type)
+    entry = CQL_TYPE_MAP.get(base_type, {})
+    return TypeInfo(
+        cql_type=cql_type,
+        base_type=base_type,
+        type_params=params,
+        **entry,
+    )
+
+
+def _to_int(value: Any) -> int:
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    return float(value)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def _to_uuid(value: Any) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    if not value:
+        return uuid.uuid4()
+    return uuid.UUID(str(value))
+
+
+def _to_timeuuid(value: Any) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def _to_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
 
-    if base_type in CQL_TYPE_MAP:
-        info = CQL_TYPE_MAP[base_type].copy()
-        info['cql_type'] = cql_type
-        info['base_type'] = base_type
-        info['type_params'] = params
-        return info
 
-    # Default for unknown types
-    return {
-        'python_type': str,
-        'widget': 'lineedit',
-        'cql_type': cql_type,
-        'base_type': base_type,
-        'type_params': params
-    }
+def _to_time(value: Any) -> time:
+    if isinstance(value, time):
+        return value
+    return time.fromisoformat(str(value))
+
+
+def _to_list(value: Any) -> list:
+    if isinstance(value, list):
+        return value
+    return json.loads(value)
+
+
+def _to_set(value: Any) -> set:
+    if isinstance(value, (set, list)):
+        return set(value) if isinstance(value, list) else value
+    return set(json.loads(value))
+
+
+def _to_map(value: Any) -> dict:
+    if isinstance(value, dict):
+        return value
+    return json.loads(value)
+
+
+def _to_blob(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return bytes.fromhex(value.replace(' ', ''))
+
+
+# Dispatch by base type: one dict probe instead of up to a dozen
+# sequential string comparisons per converted value. Unknown types fall
+# through to str, matching the old chain's default.
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    'int': _to_int,
+    'bigint': _to_int,
+    'smallint': _to_int,
+    'tinyint': _to_int,
+    'varint': _to_int,
+    'float': _to_float,
+    'double': _to_float,
+    'decimal': _to_decimal,
+    'boolean': _to_boolean,
+    'uuid': _to_uuid,
+    'timeuuid': _to_timeuuid,
+    'timestamp': _to_timestamp,
+    'date': _to_date,
+    'time': _to_time,
+    'list': _to_list,
+    'set': _to_set,
+    'map': _to_map,
+    'blob': _to_blob,
+}
+
+
+def convert_value_base(value: Any, base_type: str,
+                       params: Optional[Tuple[str, ...]] = None) -> Any:
+    """
+    Convert a Python value given an already-parsed base type.
+
+    Callers that hold parsed column metadata (e.g. ColumnInfo.base_type)
+    use this directly and skip re-parsing the type string per value.
+
+    Args:
+        value: Value to convert.
+        base_type: Parsed CQL base type, e.g. 'list' for 'list<text>'.
+        params: Generic type parameters (currently unused).
+
+    Returns:
+        Converted value.
+    """
+    if value is None or value == '':
+        return None
+    return _CONVERTERS.get(base_type, str)(value)
 
 
 def convert_value(value: Any, cql_type: str) -> Any:
@@ -132,119 +279,105 @@ def convert_value(value: Any, cql_type: str) -> Any:
     Returns:
         Converted value.
     """
-    import json
+    base_type, params = parse_cql_type(cql_type)
+    return convert_value_base(value, base_type, params)
 
-    if value is None or value == '':
-        return None
 
-    base_type, params = parse_cql_type(cql_type)
+def _format_collection(value: Any) -> str:
+    if isinstance(value, set):
+        value = list(value)
+    return json.dumps(value, default=str)
 
-    if base_type in ('int', 'bigint', 'smallint', 'tinyint', 'varint'):
-        return int(value)
-
-    elif base_type in ('float', 'double'):
-        return float(value)
-
-    elif base_type == 'decimal':
-        return Decimal(str(value))
-
-    elif base_type == 'boolean':
-        if isinstance(value, bool):
-            return value
-        return str(value).lower() in ('true', '1', 'yes')
-
-    elif base_type == 'uuid':
-        if isinstance(value, uuid.UUID):
-            return value
-        if not value:
-            return uuid.uuid4()
-        return uuid.UUID(str(value))
-
-    elif base_type == 'timeuuid':
-        if isinstance(value, uuid.UUID):
-            return value
-        return uuid.UUID(str(value))
-
-    elif base_type == 'timestamp':
-        if isinstance(value, datetime):
-            return value
-        return datetime.fromisoformat(str(value))
-
-    elif base_type == 'date':
-        if isinstance(value, date):
-            return value
-        return date.fromisoformat(str(value))
-
-    elif base_type == 'time':
-        if isinstance(value, time):
-            return value
-        return time.fromisoformat(str(value))
-
-    elif base_type == 'list':
-        if isinstance(value, list):
-            return value
-        return json.loads(value)
-
-    elif base_type == 'set':
-        if isinstance(value, (set, list)):
-            return set(value) if isinstance(value, list) else value
-        return set(json.loads(value))
-
-    elif base_type == 'map':
-        if isinstance(value, dict):
-            return value
-        return json.loads(value)
-
-    elif base_type == 'blob':
-        if isinstance(value, bytes):
-            return value
-        return bytes.fromhex(value.replace(' ', ''))
-
-    # Default: return as string
+
+def _format_blob(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.hex()
     return str(value)
 
 
-def format_value_for_display(value: Any, cql_type: str) -> str:
+def _format_timestamp(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_date(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_time(value: Any) -> str:
+    if isinstance(value, time):
+        return value.isoformat()
+    return str(value)
+
+
+# Display-side counterpart of _CONVERTERS; types without an entry
+# render via plain str.
+_FORMATTERS: dict[str, Callable[[Any], str]] = {
+    'list': _format_collection,
+    'set': _format_collection,
+    'map': _format_collection,
+    'blob': _format_blob,
+    'timestamp': _format_timestamp,
+    'date': _format_date,
+    'time': _format_time,
+}
+
+
+def _format_value_base(value: Any, base_type: str) -> str:
+    """Format a value for display; see format_value_for_display."""
+    if value is None:
+        return ''
+    return _FORMATTERS.get(base_type, str)(value)
+
+
+_format_value_cached = lru_cache(maxsize=8192)(_format_value_base)
+
+
+def format_value_for_display_base(value: Any, base_type: str) -> str:
     """
-    Format a value for display in the UI.
+    Format a value for display given an already-parsed base type.
+
+    Results are memoized per (value, base type): a page of Cassandra
+    rows is highly repetitive (booleans, enums, shared timestamps), and
+    the grid re-formats visible cells on every repaint, so most calls
+    become a cache hit. Unhashable values (lists, dicts, bytearrays)
+    bypass the cache. Call cache_clear() when column types may have
+    changed.
 
     Args:
         value: Value to format.
-        cql_type: CQL type of the value.
+        base_type: Parsed CQL base type, e.g. 'list' for 'list<text>'.
 
     Returns:
         String representation for display.
     """
-    import json
+    try:
+        return _format_value_cached(value, base_type)
+    except TypeError:
+        return _format_value_base(value, base_type)
 
-    if value is None:
-        return ''
-
-    base_type, _ = parse_cql_type(cql_type)
 
-    if base_type in ('list', 'set', 'map'):
-        if isinstance(value, set):
-            value = list(value)
-        return json.dumps(value, default=str)
+def format_value_for_display(value: Any, cql_type: str) -> str:
+    """
+    Format a value for display in the UI.
 
-    elif base_type == 'blob':
-        if isinstance(value, bytes):
-            return value.hex()
-        return str(value)
+    Thin wrapper over format_value_for_display_base for callers that
+    only hold the full type string; keying the shared cache on the base
+    type also means e.g. list<text> and list<int> values share entries.
 
-    elif base_type == 'timestamp':
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return str(value)
+    Args:
+        value: Value to format.
+        cql_type: CQL type of the value.
 
-    elif base_type == 'date':
-        if isinstance(value, date):
-            return value.isoformat()
-        return str(value)
+    Returns:
+        String representation for display.
+    """
+    base_type, _ = parse_cql_type(cql_type)
+    return format_value_for_display_base(value, base_type)
 
-    elif base_type == 'time':
-        if isinstance(value, time):
-            return value.isoformat()
-        return str(value)
 
-    return str(value)
\ No newline at end of file
+format_value_for_display.cache_clear = _format_value_cached.cache_clear
+format_value_for_display_base.cache_clear = _format_value_cached.cache_clear
\ No newline at end of file